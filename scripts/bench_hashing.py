@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.recon_engine.utils import stable_fingerprint  # noqa: E402
+
+WORDS = ["alice", "bob", "carla", "david", "main", "lake", "pine", "johnson", "smith", "diaz", "st", "rd"]
+
+
+def make_pairs(count: int, seed: int) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    return [
+        (" ".join(rng.choices(WORDS, k=2)), f"{rng.randrange(1, 9999)} {' '.join(rng.choices(WORDS, k=2))}")
+        for _ in range(count)
+    ]
+
+
+def builtin_key(name: str, address: str) -> str:
+    return f"fallback:{hash((name, address))}"
+
+
+def sha1_key(name: str, address: str) -> str:
+    return "fallback:" + hashlib.sha1(f"{name}\x1f{address}".encode("utf-8")).hexdigest()[:16]
+
+
+def stable_key(name: str, address: str) -> str:
+    return f"fallback:{stable_fingerprint(name, address).hex()}"
+
+
+METHODS: dict[str, Callable[[str, str], str]] = {
+    "builtin_hash": builtin_key,
+    "sha1": sha1_key,
+    "stable_fingerprint": stable_key,
+}
+
+
+def throughput(method: Callable[[str, str], str], pairs: list[tuple[str, str]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for name, address in pairs:
+            method(name, address)
+        best = min(best, time.perf_counter() - start)
+    return len(pairs) / best
+
+
+def keys_in_subprocess(method: str, hash_seed: str, count: int, seed: int) -> str:
+    probe = (
+        "import hashlib, sys; sys.path.insert(0, 'scripts'); import bench_hashing as b; "
+        f"keys = [b.METHODS[{method!r}](n, a) for n, a in b.make_pairs({count}, {seed})]; "
+        "print(hashlib.sha1('\\n'.join(keys).encode()).hexdigest())"
+    )
+    env = {**os.environ, "PYTHONHASHSEED": hash_seed}
+    return subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare fallback-key hashing speed and cross-process stability")
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    pairs = make_pairs(args.records, args.seed)
+    results: dict[str, Any] = {}
+    for name, method in METHODS.items():
+        results[name] = {
+            "keys_per_s": round(throughput(method, pairs, args.repeat)),
+            "stable_across_processes": len(
+                {keys_in_subprocess(name, hash_seed, 1000, args.seed) for hash_seed in ("1", "2")}
+            )
+            == 1,
+        }
+    print(json.dumps({"records": args.records, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.recon_engine.matching import ClusterReport, MatchLimits, cluster_records  # noqa: E402
+from src.recon_engine.normalization import normalize_record  # noqa: E402
+from src.recon_engine.reporting import write_csv  # noqa: E402
+
+FIRST_NAMES = [
+    "alice", "bob", "carla", "david", "elena", "farid", "grace", "hiro", "ines", "jamal",
+    "kira", "liam", "maya", "noah", "olga", "pedro", "quinn", "rosa", "sven", "tara",
+    "umar", "vera", "wes", "xenia", "yusuf", "zoe", "anton", "bianca", "chen", "dara",
+]
+LAST_NAMES = [
+    "johnson", "smith", "diaz", "nguyen", "kowalski", "haddad", "okafor", "tanaka", "silva", "murphy",
+    "rossi", "schmidt", "novak", "garcia", "ivanova", "brown", "larsen", "mendes", "khan", "walsh",
+    "adeyemi", "becker", "costa", "dubois", "eriksen", "fischer", "gupta", "hansen", "ito", "jensen",
+]
+STREETS = ["Main St", "Lake Rd", "Pine Ave", "Oak Blvd", "Hill Ln"]
+DOMAINS = ["example.com", "mail.test", "corp.test", "inbox.test"]
+
+
+def _typo(rng: random.Random, text: str) -> str:
+    if len(text) < 4:
+        return text
+    i = rng.randrange(1, len(text) - 1)
+    edit = rng.choice(("swap", "drop", "double"))
+    if edit == "swap":
+        return text[:i] + text[i + 1] + text[i] + text[i + 2 :]
+    if edit == "drop":
+        return text[:i] + text[i + 1 :]
+    return text[:i] + text[i] + text[i:]
+
+
+def make_entity(rng: random.Random, index: int) -> dict[str, str]:
+    first = rng.choice(FIRST_NAMES)
+    last = rng.choice(LAST_NAMES)
+    return {
+        "customer_id": f"CUST-{100000 + index}",
+        "name": f"{first} {last}",
+        "email": f"{first[0]}{last}{rng.randrange(1000)}@{rng.choice(DOMAINS)}",
+        "phone": f"555{rng.randrange(10**7):07d}",
+        "dob": f"{rng.randrange(1950, 2004)}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}",
+        "address": f"{rng.randrange(1, 999)} {rng.choice(STREETS)}",
+        "amount": f"{rng.randrange(100, 5000)}.00",
+    }
+
+
+def make_variant(rng: random.Random, entity: dict[str, str], noise: float) -> dict[str, str]:
+    row = dict(entity)
+    if rng.random() < 0.5:
+        row["customer_id"] = ""
+    if rng.random() < noise:
+        row["name"] = _typo(rng, row["name"])
+    if rng.random() < noise:
+        row["name"] = " ".join(reversed(row["name"].split()))
+    if rng.random() < noise:
+        row["email"] = "" if rng.random() < 0.5 else row["email"].upper()
+    if rng.random() < noise:
+        row["phone"] = ""
+    elif rng.random() < noise:
+        phone = row["phone"]
+        row["phone"] = f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
+    if rng.random() < noise / 2:
+        row["dob"] = ""
+    return row
+
+
+def generate_dataset(
+    entities: int, max_copies: int, noise: float, seed: int
+) -> tuple[list[dict[str, Any]], dict[int, int]]:
+    rng = random.Random(seed)
+    records: list[dict[str, Any]] = []
+    truth: dict[int, int] = {}
+    for index in range(entities):
+        entity = make_entity(rng, index)
+        for _ in range(rng.randint(1, max_copies)):
+            row = make_variant(rng, entity, noise)
+            source = rng.choice(("crm", "billing", "support"))
+            rec = normalize_record(row, source_name=source, row_num=len(records) + 1)
+            truth[id(rec)] = index
+            records.append(rec)
+    rng.shuffle(records)
+    return records, truth
+
+
+def _pairs(n: int) -> int:
+    return n * (n - 1) // 2
+
+
+def pairwise_scores(groups: list[list[dict[str, Any]]], truth: dict[int, int]) -> dict[str, float]:
+    predicted = sum(_pairs(len(g)) for g in groups)
+    correct = sum(
+        _pairs(count) for g in groups for count in Counter(truth[id(rec)] for rec in g).values()
+    )
+    actual = sum(_pairs(count) for count in Counter(truth.values()).values())
+    precision = correct / predicted if predicted else 1.0
+    recall = correct / actual if actual else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"precision": round(precision, 4), "recall": round(recall, 4), "f1": round(f1, 4)}
+
+
+def evaluate(
+    records: list[dict[str, Any]], truth: dict[int, int], threshold: float, limits: MatchLimits
+) -> dict[str, Any]:
+    report = ClusterReport()
+    start = time.perf_counter()
+    groups = cluster_records(records, threshold=threshold, limits=limits, report=report)
+    elapsed = time.perf_counter() - start
+    return {
+        "threshold": threshold,
+        "strategy": limits.strategy,
+        "candidate_cap": limits.candidate_cap,
+        **pairwise_scores(list(groups.values()), truth),
+        "runtime_ms": round(elapsed * 1000.0, 1),
+        "comparisons": report.comparisons,
+        "groups": len(groups),
+    }
+
+
+def mark_pareto(results: list[dict[str, Any]]) -> None:
+    for row in results:
+        row["pareto"] = not any(
+            other["f1"] >= row["f1"]
+            and other["runtime_ms"] <= row["runtime_ms"]
+            and (other["f1"] > row["f1"] or other["runtime_ms"] < row["runtime_ms"])
+            for other in results
+        )
+
+
+def _floats(text: str) -> list[float]:
+    return [float(v) for v in text.split(",") if v]
+
+
+def _ints(text: str) -> list[int]:
+    return [int(v) for v in text.split(",") if v]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure clustering accuracy against runtime on labelled data")
+    parser.add_argument("--entities", type=int, default=2000, help="Ground-truth entities to generate")
+    parser.add_argument("--max-copies", type=int, default=4, help="Maximum records per entity")
+    parser.add_argument("--noise", type=float, default=0.3, help="Probability of each perturbation")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--thresholds", default="0.8,0.85,0.9,0.95")
+    parser.add_argument("--strategies", default="all,blocked")
+    parser.add_argument("--candidate-caps", default="0", help="Comma-separated MatchLimits.candidate_cap values")
+    parser.add_argument("--csv", default=None, help="Also write results to this CSV for charting")
+    args = parser.parse_args()
+
+    records, truth = generate_dataset(args.entities, args.max_copies, args.noise, args.seed)
+    results = [
+        evaluate(records, truth, threshold, MatchLimits(strategy=strategy, candidate_cap=cap))
+        for strategy in args.strategies.split(",")
+        for cap in _ints(args.candidate_caps)
+        for threshold in _floats(args.thresholds)
+    ]
+    mark_pareto(results)
+    print(json.dumps({"records": len(records), "entities": args.entities, "results": results}, indent=2))
+    if args.csv:
+        write_csv(str(Path(args.csv).resolve()), results, list(results[0].keys()) if results else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ("requests", "pdfplumber", "rapidfuzz", "ijson")
+
+
+def cold_start_ms(runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "src.recon_engine", "--help"],
+            cwd=ROOT,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return timings
+
+
+def import_profile(top: int) -> list[dict[str, float | str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.recon_engine.cli"],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = line.split(":", 1)[1].split("|")
+        rows.append(
+            {
+                "module": module.strip(),
+                "self_ms": int(self_us) / 1000.0,
+                "cumulative_ms": int(cumulative_us) / 1000.0,
+            }
+        )
+    rows.sort(key=lambda r: r["cumulative_ms"], reverse=True)
+    return rows[:top]
+
+
+def heavy_modules_loaded() -> list[str]:
+    probe = (
+        "import json, sys, src.recon_engine.cli; "
+        f"print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure CLI cold-start latency and import cost")
+    parser.add_argument("--runs", type=int, default=10, help="Cold-start samples to take")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail if median cold start exceeds this")
+    args = parser.parse_args()
+
+    timings = cold_start_ms(args.runs)
+    median = statistics.median(timings)
+    result = {
+        "cold_start_ms": {
+            "median": round(median, 1),
+            "min": round(min(timings), 1),
+            "max": round(max(timings), 1),
+            "runs": args.runs,
+        },
+        "heavy_modules_loaded": heavy_modules_loaded(),
+        "slowest_imports": import_profile(args.top),
+    }
+    print(json.dumps(result, indent=2))
+
+    if result["heavy_modules_loaded"]:
+        sys.exit("Optional dependencies are imported at CLI startup: " + ", ".join(result["heavy_modules_loaded"]))
+    if args.max_ms is not None and median > args.max_ms:
+        sys.exit(f"Median cold start {median:.1f} ms exceeds budget of {args.max_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
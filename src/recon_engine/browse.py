@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import csv
+import io
+import os
+from array import array
+from typing import Any, Iterator
+
+INDEX_STRIDE = 256
+ARTIFACTS = ("unified_dataset", "mismatch_report", "duplicate_records", "normalized_records")
+
+
+def _matches(value: str, wanted: str) -> bool:
+    return value == wanted or wanted in (part.strip() for part in value.split(","))
+
+
+class CsvPager:
+    def __init__(self, path: str, stride: int = INDEX_STRIDE) -> None:
+        self.path = path
+        self.stride = stride
+        self.header: list[str] = []
+        self._offsets = array("q")
+        self._rows = 0
+        self._build_index()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def _build_index(self) -> None:
+        with open(self.path, "rb") as f:
+            offset = 0
+            start = 0
+            quotes = 0
+            records = -1
+            for line in f:
+                quotes += line.count(b'"')
+                offset += len(line)
+                if quotes % 2:
+                    continue
+                if records == -1:
+                    f.seek(0)
+                    self.header = next(csv.reader(io.StringIO(f.read(offset).decode("utf-8"), newline="")), [])
+                elif records % self.stride == 0:
+                    self._offsets.append(start)
+                records += 1
+                start = offset
+                quotes = 0
+            self._rows = max(records, 0)
+
+    def _reader_at(self, raw: Any, row: int) -> tuple[io.TextIOWrapper, Iterator[list[str]]]:
+        block = row // self.stride
+        raw.seek(self._offsets[block])
+        text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        reader = csv.reader(text)
+        for _ in range(row - block * self.stride):
+            next(reader)
+        return text, reader
+
+    def page(self, start: int, limit: int) -> list[dict[str, str]]:
+        stop = min(start + limit, self._rows)
+        return self.rows_at(range(start, stop))
+
+    def rows_at(self, positions: Any) -> list[dict[str, str]]:
+        out: list[dict[str, str]] = []
+        with open(self.path, "rb") as raw:
+            text = None
+            reader: Iterator[list[str]] = iter(())
+            current = -1
+            for pos in positions:
+                if pos < 0 or pos >= self._rows:
+                    continue
+                if text is None or pos < current or pos // self.stride > current // self.stride:
+                    if text is not None:
+                        text.detach()
+                    text, reader = self._reader_at(raw, pos)
+                    current = pos
+                while current < pos:
+                    next(reader)
+                    current += 1
+                out.append(dict(zip(self.header, next(reader))))
+                current += 1
+            if text is not None:
+                text.detach()
+        return out
+
+    def iter_rows(self) -> Iterator[tuple[int, dict[str, str]]]:
+        if not self._rows:
+            return
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            next(reader)
+            for pos, values in enumerate(reader):
+                yield pos, dict(zip(self.header, values))
+
+    def find(self, filters: dict[str, str], limit: int | None = None) -> array:
+        wanted = {k: v for k, v in filters.items() if v and k in self.header}
+        positions = array("q")
+        if not wanted:
+            positions.extend(range(self._rows if limit is None else min(limit, self._rows)))
+            return positions
+        for pos, row in self.iter_rows():
+            if all(_matches(row.get(k, ""), v) for k, v in wanted.items()):
+                positions.append(pos)
+                if limit is not None and len(positions) >= limit:
+                    break
+        return positions
+
+
+def open_artifacts(out_dir: str) -> dict[str, CsvPager]:
+    pagers = {}
+    for name in ARTIFACTS:
+        path = os.path.join(out_dir, f"{name}.csv")
+        if os.path.exists(path):
+            pagers[name] = CsvPager(path)
+    return pagers
+
+
+def group_members(pagers: dict[str, CsvPager], group_id: str) -> dict[str, Any]:
+    def first(name: str) -> dict[str, str] | None:
+        pager = pagers.get(name)
+        if pager is None:
+            return None
+        hits = pager.find({"group_id": group_id}, limit=1)
+        return pager.rows_at(hits)[0] if hits else None
+
+    golden = first("unified_dataset")
+    mismatch = first("mismatch_report")
+    keys: set[tuple[str, str]] = set()
+    duplicates = pagers.get("duplicate_records")
+    if duplicates is not None:
+        keys = {
+            (row["source_name"], row["source_row"])
+            for row in duplicates.rows_at(duplicates.find({"group_id": group_id}))
+        }
+    members: list[dict[str, str]] = []
+    normalized = pagers.get("normalized_records")
+    if keys and normalized is not None:
+        for _, row in normalized.iter_rows():
+            if (row.get("source_name"), row.get("source_row")) in keys:
+                members.append(row)
+                if len(members) == len(keys):
+                    break
+    return {"group_id": group_id, "golden": golden, "mismatch": mismatch, "members": members}
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from dataclasses import asdict
+from typing import Any
+
+from .config import EngineConfig
+from .ingestion import expand_source_paths, is_multi_file_path, is_url, sqlite_path
+
+
+CHECKPOINT_DIR = ".checkpoints"
+OUTPUT_ONLY_SETTINGS = ("output_mode", "output_formats", "checkpoints", "http_cache")
+
+
+def run_fingerprint(config: EngineConfig) -> str:
+    digest = hashlib.sha256()
+    settings = {k: v for k, v in asdict(config).items() if k not in OUTPUT_ONLY_SETTINGS}
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode("utf-8"))
+    for src in config.sources:
+        if is_url(src.path):
+            # Remote endpoints cannot be checked without fetching them, so never resume from them.
+            digest.update(f"{src.path}|{time.time_ns()}\n".encode("utf-8"))
+            continue
+        if src.type.lower() == "sql":
+            db_path = sqlite_path(src.path)
+            if db_path and os.path.exists(db_path):
+                stat = os.stat(db_path)
+                digest.update(f"{db_path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+            else:
+                # Same for remote databases: there is no cheap change marker.
+                digest.update(f"{src.path}|{time.time_ns()}\n".encode("utf-8"))
+            continue
+        try:
+            paths = expand_source_paths(src.path) if is_multi_file_path(src.path) else [src.path]
+        except ValueError:
+            paths = [src.path]
+        for path in paths:
+            if os.path.exists(path):
+                stat = os.stat(path)
+                digest.update(f"{path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+            else:
+                digest.update(f"{path}|missing\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class StageCheckpoints:
+    def __init__(self, out_dir: str, fingerprint: str) -> None:
+        self.root = os.path.join(out_dir, CHECKPOINT_DIR)
+        self.fingerprint = fingerprint
+
+    def _path(self, stage: str) -> str:
+        return os.path.join(self.root, f"{stage}.pkl")
+
+    def load(self, stage: str) -> Any | None:
+        path = self._path(stage)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                if pickle.load(f) != self.fingerprint:
+                    return None
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def save(self, stage: str, payload: Any) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(stage)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self.fingerprint, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
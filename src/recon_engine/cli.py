@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 
 from .config import EngineConfig
 from .engine import ReconciliationEngine
@@ -10,10 +11,49 @@ from .engine import ReconciliationEngine
 def main() -> None:
     parser = argparse.ArgumentParser(description="Multi-source data reconciliation engine")
     parser.add_argument("--config", required=True, help="Path to JSON config")
+    parser.add_argument("--resume", action="store_true", help="Reuse stage checkpoints when config and inputs match")
+    parser.add_argument("--delta", action="store_true", help="Write only changes since the previous run")
+    parser.add_argument(
+        "--preview",
+        type=int,
+        nargs="?",
+        const=1000,
+        default=None,
+        metavar="N",
+        help="Reconcile a sample of up to N records per source and project duplicate/mismatch rates",
+    )
+    parser.add_argument("--lookup", default=None, help="Query the entity index, e.g. email=alice@example.com")
+    parser.add_argument("--lookup-name", default=None, help="Fuzzy-search the entity index by name")
+    parser.add_argument("--serve", action="store_true", help="Run as a long-lived service with a warm entity index")
+    parser.add_argument("--host", default="127.0.0.1", help="Service bind address")
+    parser.add_argument("--port", type=int, default=8765, help="Service port")
+    parser.add_argument("--socket", default=None, help="Serve on this Unix socket path instead of TCP")
     args = parser.parse_args()
 
     config = EngineConfig.load(args.config)
-    result = ReconciliationEngine(config).run()
+    if args.delta:
+        config.output_mode = "delta"
+    if args.lookup or args.lookup_name:
+        from .lookup import INDEX_FILENAME, EntityLookup
+
+        with EntityLookup(os.path.join(config.output_dir, INDEX_FILENAME)) as index:
+            if args.lookup:
+                field, _, value = args.lookup.partition("=")
+                print(json.dumps(index.lookup(field.strip(), value), indent=2))
+            else:
+                print(json.dumps(index.search_name(args.lookup_name), indent=2))
+        return
+    if args.preview is not None:
+        from .preview import run_preview
+
+        print(json.dumps(run_preview(config, sample_size=args.preview), indent=2))
+        return
+    if args.serve:
+        from .service import serve
+
+        serve(config, host=args.host, port=args.port, socket_path=args.socket)
+        return
+    result = ReconciliationEngine(config).run(resume=args.resume)
     print(json.dumps(result, indent=2))
 
 
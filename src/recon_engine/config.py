@@ -1,7 +1,153 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+import math
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+
+def parse_bool(value: object, name: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    text = str(value).strip().lower()
+    if text in ("true", "yes", "on", "1"):
+        return True
+    if text in ("false", "no", "off", "0", ""):
+        return False
+    raise ValueError(f"Invalid boolean for {name}: {value!r}")
+
+
+MATCH_STRATEGIES = ("all", "blocked")
+
+
+@dataclass
+class MatchLimits:
+    strategy: str = "all"
+    max_key_size: int = 1000
+    max_block_size: int = 1000
+    comparison_budget: int = 0
+    candidate_cap: int = 0
+
+    @classmethod
+    def from_dict(cls, raw: Any) -> "MatchLimits":
+        if not isinstance(raw, dict):
+            raise ValueError(f"match_limits must be an object, got {raw!r}")
+        names = [f.name for f in fields(cls)]
+        unknown = sorted(set(raw) - set(names))
+        if unknown:
+            raise ValueError(f"Unknown match_limits settings: {', '.join(unknown)}")
+        strategy = str(raw.get("strategy", cls.strategy)).lower()
+        if strategy not in MATCH_STRATEGIES:
+            choices = ", ".join(MATCH_STRATEGIES)
+            raise ValueError(f"match_limits.strategy must be one of {choices}: {strategy!r}")
+        values: dict[str, int] = {}
+        for name in names[1:]:
+            value = raw.get(name, getattr(cls, name))
+            if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+                raise ValueError(f"match_limits.{name} must be an integer: {value!r}")
+            try:
+                number = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"match_limits.{name} must be an integer: {value!r}") from None
+            if number < 0:
+                raise ValueError(f"match_limits.{name} must not be negative: {value!r}")
+            values[name] = number
+        return cls(strategy=strategy, **values)
+
+
+def _default_place_rules() -> list[dict[str, Any]]:
+    return [
+        {"name": "dob_name", "all": [{"field": "dob", "op": "equal"}, {"field": "name", "op": "similar"}]},
+        {"name": "strong_name", "all": [{"field": "name", "op": "similar", "offset": 0.05}]},
+    ]
+
+
+def _default_merge_rules() -> list[dict[str, Any]]:
+    return [
+        {
+            "name": "phone_name",
+            "all": [{"field": "phone", "op": "equal"}, {"field": "name", "op": "similar", "offset": -0.1}],
+        },
+        {"name": "dob_name", "all": [{"field": "dob", "op": "equal"}, {"field": "name", "op": "similar"}]},
+        {
+            "name": "dob_email",
+            "all": [{"field": "dob", "op": "equal"}, {"field": "email", "op": "similar", "offset": -0.05}],
+        },
+        {
+            "name": "name_email",
+            "all": [
+                {"field": "name", "op": "similar", "offset": 0.05},
+                {"field": "email", "op": "similar", "offset": -0.05},
+            ],
+        },
+    ]
+
+
+MATCH_FIELDS = ("name", "email", "email_local", "phone", "dob")
+MATCH_OPS = ("equal", "similar")
+
+
+def _score_setting(value: Any, where: str) -> float:
+    if isinstance(value, bool):
+        raise ValueError(f"{where} must be a number: {value!r}")
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{where} must be a number: {value!r}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"{where} must be finite: {value!r}")
+    return number
+
+
+def validate_match_rules(rules: Any, stage: str) -> list[dict[str, Any]]:
+    if not isinstance(rules, list):
+        raise ValueError(f"match_rules.{stage} must be a list of rules")
+    out = []
+    for position, rule in enumerate(rules):
+        where = f"match_rules.{stage}[{position}]"
+        if not isinstance(rule, dict) or set(rule) - {"name", "all"}:
+            raise ValueError(f"{where} must be an object with 'name' and 'all'")
+        name = rule.get("name")
+        conditions = rule.get("all")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"{where} needs a non-empty 'name'")
+        if not isinstance(conditions, list) or not conditions:
+            raise ValueError(f"{where} needs at least one condition in 'all'")
+        checked = []
+        for cond in conditions:
+            if not isinstance(cond, dict):
+                raise ValueError(f"{where} condition must be an object: {cond!r}")
+            unknown = set(cond) - {"field", "op", "offset", "min"}
+            if unknown or cond.get("field") not in MATCH_FIELDS or cond.get("op", "similar") not in MATCH_OPS:
+                raise ValueError(f"{where} has an unsupported condition: {cond!r}")
+            if "min" in cond and "offset" in cond:
+                raise ValueError(f"{where} condition sets both 'min' and 'offset': {cond!r}")
+            entry = {"field": cond["field"], "op": cond.get("op", "similar")}
+            if "min" in cond:
+                entry["min"] = _score_setting(cond["min"], f"{where}.min")
+            else:
+                entry["offset"] = _score_setting(cond.get("offset", 0.0), f"{where}.offset")
+            checked.append(entry)
+        out.append({"name": name.strip(), "all": checked})
+    return out
+
+
+@dataclass
+class MatchRules:
+    place: list[dict[str, Any]] = field(default_factory=_default_place_rules)
+    merge: list[dict[str, Any]] = field(default_factory=_default_merge_rules)
+
+    def __post_init__(self) -> None:
+        self.place = validate_match_rules(self.place, "place")
+        self.merge = validate_match_rules(self.merge, "merge")
+
+    @classmethod
+    def from_dict(cls, raw: Any) -> "MatchRules":
+        if not isinstance(raw, dict) or set(raw) - {"place", "merge"}:
+            raise ValueError("match_rules must be an object with optional 'place' and 'merge' lists")
+        return cls(**raw)
 
 
 @dataclass
@@ -10,6 +156,10 @@ class SourceConfig:
     type: str
     path: str
     field_map: dict[str, str] = field(default_factory=dict)
+    query: str = ""
+    since: str = ""
+    incremental_column: str = "updated_at"
+    batch_size: int = 1000
 
 
 @dataclass
@@ -21,6 +171,16 @@ class EngineConfig:
     output_dir: str
     similarity_threshold: float
     field_aliases: dict[str, list[str]] = field(default_factory=dict)
+    numeric_tolerance: float = 0.005
+    ingest_workers: int = 4
+    output_mode: str = "full"
+    output_formats: list[str] = field(default_factory=lambda: ["csv"])
+    normalization_mode: str = "row"
+    collapse_exact_duplicates: bool = True
+    checkpoints: bool = False
+    http_cache: bool = True
+    match_limits: MatchLimits = field(default_factory=MatchLimits)
+    match_rules: MatchRules = field(default_factory=MatchRules)
 
     @classmethod
     def load(cls, path: str) -> "EngineConfig":
@@ -34,4 +194,16 @@ class EngineConfig:
             output_dir=raw["output_dir"],
             similarity_threshold=float(raw.get("similarity_threshold", 0.9)),
             field_aliases=raw.get("field_aliases", {}),
+            numeric_tolerance=float(raw.get("numeric_tolerance", 0.005)),
+            ingest_workers=int(raw.get("ingest_workers", 4)),
+            output_mode=str(raw.get("output_mode", "full")).lower(),
+            output_formats=[str(fmt).lower() for fmt in raw.get("output_formats", ["csv"])],
+            normalization_mode=str(raw.get("normalization_mode", "row")).lower(),
+            collapse_exact_duplicates=parse_bool(
+                raw.get("collapse_exact_duplicates", True), "collapse_exact_duplicates"
+            ),
+            checkpoints=parse_bool(raw.get("checkpoints", False), "checkpoints"),
+            http_cache=parse_bool(raw.get("http_cache", True), "http_cache"),
+            match_limits=MatchLimits.from_dict(raw.get("match_limits", {})),
+            match_rules=MatchRules.from_dict(raw.get("match_rules", {})),
         )
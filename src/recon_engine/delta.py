@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any
+
+from .reporting import write_csv, write_json
+
+
+SNAPSHOT_FILENAME = "run_snapshot.json"
+UNIFIED_DELTA_FILENAME = "unified_delta.csv"
+MISMATCH_DELTA_FILENAME = "mismatch_delta.csv"
+PROVENANCE_FIELDS = ("source_name", "source_row", "golden_source")
+
+
+def row_digest(row: dict[str, Any], exclude: tuple[str, ...] = PROVENANCE_FIELDS) -> str:
+    business = {k: v for k, v in row.items() if k not in exclude}
+    payload = json.dumps(business, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def load_snapshot(out_dir: str) -> dict[str, dict[str, str]]:
+    path = os.path.join(out_dir, SNAPSHOT_FILENAME)
+    if not os.path.exists(path):
+        return {"golden": {}, "mismatches": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    return {"golden": raw.get("golden", {}), "mismatches": raw.get("mismatches", {})}
+
+
+def diff_rows(
+    previous: dict[str, str], rows: list[dict[str, Any]], key: str = "group_id"
+) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    digests: dict[str, str] = {}
+    changes: list[dict[str, Any]] = []
+    for row in rows:
+        digest = row_digest(row)
+        digests[row[key]] = digest
+        before = previous.get(row[key])
+        if before is None:
+            changes.append({"change_type": "insert", **row})
+        elif before != digest:
+            changes.append({"change_type": "update", **row})
+    for row_key in sorted(set(previous) - set(digests)):
+        changes.append({"change_type": "delete", key: row_key})
+    return changes, digests
+
+
+def write_delta(
+    out_dir: str,
+    unified: list[dict[str, Any]],
+    mismatch_rows: list[dict[str, Any]],
+    emit_changes: bool,
+) -> tuple[dict[str, int], dict[str, dict[str, str]]]:
+    snapshot = load_snapshot(out_dir)
+    golden_changes, golden_digests = diff_rows(snapshot["golden"], unified)
+    mismatch_changes, mismatch_digests = diff_rows(snapshot["mismatches"], mismatch_rows)
+    if emit_changes:
+        write_csv(os.path.join(out_dir, UNIFIED_DELTA_FILENAME), golden_changes, _change_fields(golden_changes))
+        write_csv(os.path.join(out_dir, MISMATCH_DELTA_FILENAME), mismatch_changes, _change_fields(mismatch_changes))
+    counts = {
+        "inserted": sum(1 for c in golden_changes if c["change_type"] == "insert"),
+        "updated": sum(1 for c in golden_changes if c["change_type"] == "update"),
+        "deleted": sum(1 for c in golden_changes if c["change_type"] == "delete"),
+        "mismatch_changes": len(mismatch_changes),
+    }
+    return counts, {"golden": golden_digests, "mismatches": mismatch_digests}
+
+
+def write_snapshot(out_dir: str, snapshot: dict[str, dict[str, str]]) -> None:
+    write_json(os.path.join(out_dir, SNAPSHOT_FILENAME), snapshot)
+
+
+def stale_artifacts(out_dir: str, names: tuple[str, ...]) -> list[str]:
+    return sorted(
+        entry for entry in os.listdir(out_dir) if os.path.splitext(entry)[0] in names and not entry.endswith(".tmp")
+    )
+
+
+def _change_fields(changes: list[dict[str, Any]]) -> list[str]:
+    fields = sorted({k for row in changes for k in row.keys()} - {"change_type", "group_id"})
+    return ["change_type", "group_id"] + fields
@@ -2,51 +2,205 @@ from __future__ import annotations
 
 import os
 from collections import defaultdict
-from typing import Any
+from dataclasses import asdict
+from typing import Any, Callable
 
-from .config import EngineConfig
-from .ingestion import Ingestor
-from .matching import cluster_records, detect_field_mismatches
-from .normalization import completeness_score, normalize_record
-from .reporting import write_csv, write_json
+from .checkpoint import StageCheckpoints, run_fingerprint
+from .config import EngineConfig, SourceConfig
+from .delta import stale_artifacts, write_delta, write_snapshot
+from .http_cache import HTTP_CACHE_DIR, HttpCache
+from .ingestion import CsvTable, CursorTable, Ingestor, file_label, is_multi_file_path
+from .lookup import INDEX_FILENAME, write_entity_index
+from .matching import (
+    ClusterReport,
+    cluster_records,
+    collapse_exact_duplicates,
+    detect_field_mismatches,
+    duplicate_weights,
+    expand_exact_duplicates,
+    stable_group_id,
+)
+from .normalization import (
+    build_alias_lookup,
+    build_row_mapper,
+    build_row_normalizer,
+    completeness_score,
+    map_record,
+    normalize_batch,
+    normalize_record,
+)
+from .reporting import ARTIFACT_WRITERS, ArtifactWriter, write_json
 
 
 class ReconciliationEngine:
     def __init__(self, config: EngineConfig) -> None:
         self.config = config
-        self.ingestor = Ingestor()
+        cache = HttpCache(os.path.join(config.output_dir, HTTP_CACHE_DIR)) if config.http_cache else None
+        self.ingestor = Ingestor(max_workers=config.ingest_workers, cache=cache)
         self.priority_index = {
             name: idx for idx, name in enumerate(config.source_priority)
         }
 
-    def run(self) -> dict[str, Any]:
-        normalized: list[dict[str, Any]] = []
-        source_counts: dict[str, int] = {}
-
-        for src in self.config.sources:
-            rows = self.ingestor.read_source(src)
-            source_counts[src.name] = len(rows)
-            for i, row in enumerate(rows, start=1):
-                normalized.append(
-                    normalize_record(
-                        row,
-                        source_name=src.name,
-                        row_num=i,
-                        global_aliases=self.config.field_aliases,
-                        source_field_map=src.field_map,
-                    )
-                )
+    def run(self, resume: bool = False) -> dict[str, Any]:
+        out_dir = self.config.output_dir
+        checkpoints = None
+        if self.config.checkpoints or resume:
+            checkpoints = StageCheckpoints(out_dir, run_fingerprint(self.config))
+        resumed: list[str] = []
+        cache = self.ingestor.cache
+        if cache is not None:
+            cache.reset_stats()
+
+        def stage(name: str, compute: Any) -> Any:
+            if resume and checkpoints is not None:
+                cached = checkpoints.load(name)
+                if cached is not None:
+                    resumed.append(name)
+                    return cached
+            result = compute()
+            if checkpoints is not None:
+                checkpoints.save(name, result)
+            return result
+
+        os.makedirs(out_dir, exist_ok=True)
+        delta_mode = self.config.output_mode == "delta"
+        writers: list[ArtifactWriter] = []
+        try:
+            result = self._run_stages(out_dir, stage, writers, delta_mode)
+        except BaseException:
+            for writer in writers:
+                writer.close(commit=False)
+            raise
+        if resumed:
+            result["summary"]["resumed_stages"] = resumed
+        if cache is not None and cache.stats["requests"]:
+            result["summary"]["http_cache"] = dict(cache.stats)
+        write_json(
+            os.path.join(out_dir, "reconciliation_report.json"),
+            {"summary": result["summary"], "mismatches": result.pop("mismatches")},
+        )
+        # The snapshot only advances once everything it describes has been published.
+        write_snapshot(out_dir, result.pop("snapshot"))
+        return result
+
+    def _run_stages(
+        self,
+        out_dir: str,
+        stage: Any,
+        writers: list[ArtifactWriter],
+        delta_mode: bool,
+    ) -> dict[str, Any]:
+        write_normalized = self._open_artifact(out_dir, "normalized_records", writers)
+        streamed = False
+
+        def ingest() -> tuple[list[dict[str, Any]], dict[str, Any]]:
+            nonlocal streamed
+            streamed = True
+            return self.load_records(sink=write_normalized)
+
+        normalized, source_counts = stage("ingest", ingest)
+        if not streamed:
+            write_normalized(normalized)
+        record_index = {id(rec): i for i, rec in enumerate(normalized)}
+        cluster_state = stage("cluster", lambda: self._cluster(normalized, record_index))
+        groups = {
+            key: [normalized[i] for i in positions] for key, positions in cluster_state["groups"].items()
+        }
+        cluster_report = ClusterReport(**cluster_state["report"])
+        mismatch_rows, unified, duplicate_rows = stage(
+            "post", lambda: self._post_process(groups, cluster_report)
+        )
+        artifacts = {"duplicate_records": duplicate_rows}
+        if not delta_mode:
+            artifacts["mismatch_report"] = mismatch_rows
+            artifacts["unified_dataset"] = unified
+        for name, rows in artifacts.items():
+            self._open_artifact(out_dir, name, writers)(rows)
+        duplicates = sum(1 for recs in groups.values() if len(recs) > 1)
+        index_entries = [(golden["group_id"], recs, golden) for recs, golden in zip(groups.values(), unified)]
+
+        summary = {
+            "total_records_ingested": len(normalized),
+            "source_counts": source_counts,
+            "entity_groups": len(groups),
+            "duplicate_groups": duplicates,
+            "duplicate_records": len(duplicate_rows),
+            "mismatch_groups": len(mismatch_rows),
+            "output_records": len(unified),
+            "exact_duplicates_collapsed": cluster_state["collapsed"],
+            "clustering": asdict(cluster_report),
+        }
+        for writer in writers:
+            writer.close()
+        write_entity_index(os.path.join(out_dir, INDEX_FILENAME), index_entries, self.config.id_columns)
+        summary["delta"], snapshot = write_delta(out_dir, unified, mismatch_rows, emit_changes=delta_mode)
+        if delta_mode:
+            stale = stale_artifacts(out_dir, ("mismatch_report", "unified_dataset"))
+            if stale:
+                summary["stale_artifacts"] = stale
+        return {"summary": summary, "output_dir": out_dir, "mismatches": mismatch_rows, "snapshot": snapshot}
+
+    def _open_artifact(
+        self, out_dir: str, name: str, writers: list[ArtifactWriter]
+    ) -> Callable[[list[dict[str, Any]]], None]:
+        opened = []
+        for fmt in self.config.output_formats:
+            if fmt not in ARTIFACT_WRITERS:
+                raise ValueError(f"Unsupported output format: {fmt}")
+            opened.append(ARTIFACT_WRITERS[fmt](os.path.join(out_dir, f"{name}.{fmt}")))
+        writers.extend(opened)
+
+        def write_rows(rows: list[dict[str, Any]]) -> None:
+            for writer in opened:
+                writer.write_rows(rows)
+
+        return write_rows
+
+    def _cluster(self, normalized: list[dict[str, Any]], record_index: dict[int, int]) -> dict[str, Any]:
+        groups, cluster_report, collapsed = self.cluster(normalized)
+        return {
+            "groups": {key: [record_index[id(rec)] for rec in recs] for key, recs in groups.items()},
+            "report": asdict(cluster_report),
+            "collapsed": collapsed,
+        }
 
-        groups = cluster_records(normalized, threshold=self.config.similarity_threshold)
-        duplicates = {k: v for k, v in groups.items() if len(v) > 1}
+    def cluster(
+        self, normalized: list[dict[str, Any]]
+    ) -> tuple[dict[str, list[dict[str, Any]]], ClusterReport, int]:
+        cluster_report = ClusterReport()
+        if self.config.collapse_exact_duplicates:
+            representatives, copies = collapse_exact_duplicates(normalized)
+        else:
+            representatives, copies = normalized, {}
+        groups = cluster_records(
+            representatives,
+            threshold=self.config.similarity_threshold,
+            limits=self.config.match_limits,
+            report=cluster_report,
+            rules=self.config.match_rules,
+            weights=duplicate_weights(copies),
+        )
+        groups = expand_exact_duplicates(groups, copies)
+        return groups, cluster_report, len(normalized) - len(representatives)
 
+    def _post_process(
+        self, groups: dict[str, list[dict[str, Any]]], cluster_report: ClusterReport
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
         mismatch_rows: list[dict[str, Any]] = []
         unified: list[dict[str, Any]] = []
         group_map: dict[str, str] = {}
-        for idx, (entity_key, recs) in enumerate(groups.items(), start=1):
-            group_id = f"G{idx:05d}"
+        used_ids: set[str] = set()
+        for entity_key, recs in groups.items():
+            group_id = base_id = stable_group_id(recs, skip=cluster_report.hot_keys)
+            suffix = 1
+            while group_id in used_ids:
+                suffix += 1
+                group_id = f"{base_id}-{suffix}"
+            used_ids.add(group_id)
             group_map[entity_key] = group_id
-            mismatch = detect_field_mismatches(recs, self.config.critical_columns)
+            mismatch = detect_field_mismatches(
+                recs, self.config.critical_columns, self.config.numeric_tolerance
+            )
             if mismatch:
                 mismatch_rows.append(
                     {
@@ -60,7 +214,9 @@ class ReconciliationEngine:
             unified.append(self._pick_golden_record(group_id, recs, mismatch))
 
         duplicate_rows = []
-        for entity_key, recs in duplicates.items():
+        for entity_key, recs in groups.items():
+            if len(recs) < 2:
+                continue
             for rec in recs:
                 duplicate_rows.append(
                     {
@@ -74,28 +230,53 @@ class ReconciliationEngine:
                         "status": rec.get("status", ""),
                     }
                 )
+        return mismatch_rows, unified, duplicate_rows
 
-        summary = {
-            "total_records_ingested": len(normalized),
-            "source_counts": source_counts,
-            "entity_groups": len(groups),
-            "duplicate_groups": len(duplicates),
-            "duplicate_records": len(duplicate_rows),
-            "mismatch_groups": len(mismatch_rows),
-            "output_records": len(unified),
-        }
+    def load_records(
+        self,
+        sources: list[SourceConfig] | None = None,
+        sink: Callable[[list[dict[str, Any]]], None] | None = None,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        normalized: list[dict[str, Any]] = []
+        source_counts: dict[str, Any] = {}
 
-        out_dir = self.config.output_dir
-        os.makedirs(out_dir, exist_ok=True)
-        write_csv(os.path.join(out_dir, "normalized_records.csv"), normalized)
-        write_csv(os.path.join(out_dir, "duplicate_records.csv"), duplicate_rows)
-        write_csv(os.path.join(out_dir, "mismatch_report.csv"), mismatch_rows)
-        write_csv(os.path.join(out_dir, "unified_dataset.csv"), unified)
-        write_json(
-            os.path.join(out_dir, "reconciliation_report.json"),
-            {"summary": summary, "mismatches": mismatch_rows},
-        )
-        return {"summary": summary, "output_dir": out_dir}
+        batch = self.config.normalization_mode == "batch"
+        for src in self.config.sources if sources is None else sources:
+            sharded = is_multi_file_path(src.path)
+            file_counts: dict[str, int] = {}
+            alias_lookup = build_alias_lookup(self.config.field_aliases, src.field_map)
+            for path, rows in self.ingestor.read_source_files(src):
+                label = file_label(src.path, path) if sharded else ""
+                if isinstance(rows, (CsvTable, CursorTable)):
+                    build = build_row_mapper if batch else build_row_normalizer
+                    convert = build(rows.header, src.name, alias_lookup)
+                    records = [
+                        convert(values, f"{label}:{i}" if sharded else i)
+                        for i, values in enumerate(rows, start=1)
+                    ]
+                elif batch:
+                    records = [
+                        map_record(row, src.name, f"{label}:{i}" if sharded else i, alias_lookup)
+                        for i, row in enumerate(rows, start=1)
+                    ]
+                else:
+                    records = [
+                        normalize_record(
+                            row,
+                            source_name=src.name,
+                            row_num=f"{label}:{i}" if sharded else i,
+                            alias_lookup=alias_lookup,
+                        )
+                        for i, row in enumerate(rows, start=1)
+                    ]
+                records = normalize_batch(records) if batch else records
+                file_counts[label] = len(records)
+                normalized.extend(records)
+                if sink is not None:
+                    sink(records)
+            total = sum(file_counts.values())
+            source_counts[src.name] = {"total": total, "files": file_counts} if sharded else total
+        return normalized, source_counts
 
     def _pick_golden_record(
         self,
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+from typing import Any
+
+
+HTTP_CACHE_DIR = ".http_cache"
+
+
+class HttpCache:
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.stats = {"requests": 0, "not_modified": 0, "fetched": 0, "stored": 0}
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.root, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".pkl")
+
+    def lookup(self, url: str) -> dict[str, Any] | None:
+        path = self._path(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        return entry if isinstance(entry, dict) and entry.get("url") == url else None
+
+    def conditional_headers(self, entry: dict[str, Any] | None) -> dict[str, str]:
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, etag: str, last_modified: str, rows: list[dict[str, Any]]) -> None:
+        if not etag and not last_modified:
+            return
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                {"url": url, "etag": etag, "last_modified": last_modified, "rows": rows},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, path)
+        self.count("stored")
@@ -1,58 +1,299 @@
 from __future__ import annotations
 
 import csv
+import glob
+import io
 import json
 import os
-from typing import Any
-
-import requests
+import re
+from typing import Any, Iterator, Sequence
+from urllib.parse import unquote, urlparse
 
 from .config import SourceConfig
-from .pdf_io import read_simple_pdf_table
-from .xlsx_io import read_simple_xlsx
+from .http_cache import HttpCache
+from .utils import optional_import
+
+
+SQL_DRIVERS = {"postgresql": "psycopg2", "postgres": "psycopg2", "mysql": "pymysql"}
+SQL_PLACEHOLDERS = {
+    "qmark": "?",
+    "numeric": ":1",
+    "named": ":since",
+    "format": "%s",
+    "pyformat": "%(since)s",
+}
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def is_url(path: str) -> bool:
+    return path.lower().startswith(("http://", "https://"))
+
+
+def is_multi_file_path(path: str) -> bool:
+    if is_url(path) or "://" in path:
+        return False
+    return os.path.isdir(path) or glob.has_magic(path)
+
+
+def _pattern_root(path: str) -> str:
+    if os.path.isdir(path):
+        return path
+    parts = []
+    for part in os.path.normpath(path).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or "."
+
+
+def expand_source_paths(path: str) -> list[str]:
+    if not is_multi_file_path(path):
+        return [path]
+    if os.path.isdir(path):
+        candidates = [os.path.join(path, name) for name in os.listdir(path) if not name.startswith(".")]
+    else:
+        candidates = glob.glob(path, recursive=True)
+    files = sorted(p for p in candidates if os.path.isfile(p))
+    if not files:
+        raise ValueError(f"No files match source path: {path}")
+    return files
+
+
+def file_label(source_path: str, file_path: str) -> str:
+    return os.path.relpath(file_path, _pattern_root(source_path)).replace(os.sep, "/")
+
+
+class CsvTable(list):
+    def __init__(self, header: list[str], rows: list[list[str]]) -> None:
+        super().__init__(rows)
+        self.header = header
+
+    def as_dicts(self) -> list[dict[str, Any]]:
+        width = len(self.header)
+        out = []
+        for values in self:
+            padded = values + [None] * (width - len(values))
+            out.append(dict(zip(self.header, padded)))
+        return out
+
+
+class CursorTable:
+    def __init__(self, header: list[str], rows: Iterator[Sequence[Any]]) -> None:
+        self.header = header
+        self._rows = rows
+
+    def __iter__(self) -> Iterator[Sequence[Any]]:
+        return self._rows
+
+    def iter_dicts(self) -> Iterator[dict[str, Any]]:
+        for values in self._rows:
+            yield dict(zip(self.header, values))
+
+    def as_dicts(self) -> list[dict[str, Any]]:
+        return list(self.iter_dicts())
+
+
+def sqlite_path(dsn: str) -> str | None:
+    if not dsn.lower().startswith("sqlite://"):
+        return None
+    path = dsn[len("sqlite://") :]
+    return path[1:] if path.startswith("/") else path
+
+
+def connect_sql(dsn: str) -> tuple[Any, Any]:
+    path = sqlite_path(dsn)
+    if path is not None:
+        import sqlite3
+
+        return sqlite3.connect(path or ":memory:"), sqlite3
+    parsed = urlparse(dsn)
+    module_name = SQL_DRIVERS.get(parsed.scheme.lower())
+    if module_name is None:
+        raise ValueError(f"Unsupported SQL connection scheme: {parsed.scheme or dsn}")
+    driver = optional_import(module_name)
+    if driver is None:
+        raise ValueError(f"SQL driver '{module_name}' is required for {parsed.scheme} sources")
+    if module_name.startswith("psycopg"):
+        return driver.connect(dsn), driver
+    return (
+        driver.connect(
+            host=parsed.hostname,
+            port=parsed.port or 3306,
+            user=unquote(parsed.username or ""),
+            password=unquote(parsed.password or ""),
+            database=parsed.path.lstrip("/"),
+        ),
+        driver,
+    )
+
+
+def build_sql_query(source: SourceConfig, paramstyle: str) -> tuple[str, Any]:
+    query = source.query.strip().rstrip(";")
+    if not query:
+        raise ValueError(f"SQL source '{source.name}' needs a 'query'")
+    if not source.since:
+        return query, ()
+    column = source.incremental_column
+    if not _IDENTIFIER.match(column):
+        raise ValueError(f"Invalid incremental column: {column}")
+    placeholder = SQL_PLACEHOLDERS.get(paramstyle, "?")
+    params: Any = {"since": source.since} if paramstyle in ("named", "pyformat") else (source.since,)
+    return f"SELECT * FROM ({query}) AS recon_src WHERE {column} > {placeholder}", params
 
 
 class Ingestor:
-    def __init__(self, timeout_s: int = 20) -> None:
+    def __init__(self, timeout_s: int = 20, max_workers: int = 4, cache: HttpCache | None = None) -> None:
         self.timeout_s = timeout_s
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
 
     def read_source(self, source: SourceConfig) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        for _, part in self.read_source_files(source):
+            rows.extend(part.as_dicts() if isinstance(part, (CsvTable, CursorTable)) else part)
+        return rows
+
+    def read_source_files(self, source: SourceConfig) -> list[tuple[str, Any]]:
+        kind = source.type.lower()
+        if kind == "sql":
+            return [(source.path, self._read_sql(source))]
+        paths = expand_source_paths(source.path)
+        if len(paths) == 1:
+            return [(paths[0], self._read_path(kind, paths[0]))]
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(self.max_workers, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(lambda p: self._read_path(kind, p), paths))
+        return list(zip(paths, parts))
+
+    def stream_source(self, source: SourceConfig) -> Iterator[tuple[str, int, dict[str, Any]]]:
         kind = source.type.lower()
+        if kind == "sql":
+            for i, row in enumerate(self._read_sql(source).iter_dicts(), start=1):
+                yield source.path, i, row
+            return
+        for path in expand_source_paths(source.path):
+            for i, row in enumerate(self._iter_path(kind, path), start=1):
+                yield path, i, row
+
+    def _iter_path(self, kind: str, path: str) -> Iterator[dict[str, Any]]:
+        if kind == "csv":
+            return self._iter_csv(path)
+        if kind == "api":
+            return self._iter_api(path)
+        return iter(self._read_path(kind, path))
+
+    def _iter_csv(self, path: str) -> Iterator[dict[str, Any]]:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            width = len(header)
+            for values in reader:
+                if values:
+                    yield dict(zip(header, values + [None] * (width - len(values))))
+
+    def _read_path(self, kind: str, path: str) -> list[Any]:
         if kind == "csv":
-            return self._read_csv(source.path)
+            return self._read_csv(path)
         if kind == "excel":
-            return self._read_excel(source.path)
+            return self._read_excel(path)
         if kind == "api":
-            return self._read_api(source.path)
+            return self._read_api(path)
         if kind == "pdf":
-            return self._read_pdf(source.path)
-        raise ValueError(f"Unsupported source type: {source.type}")
+            return self._read_pdf(path)
+        raise ValueError(f"Unsupported source type: {kind}")
 
-    def _read_csv(self, path: str) -> list[dict[str, Any]]:
+    def _read_csv(self, path: str) -> CsvTable:
         with open(path, "r", encoding="utf-8-sig", newline="") as f:
-            return list(csv.DictReader(f))
+            reader = csv.reader(f)
+            header = next(reader, [])
+            return CsvTable(header, [row for row in reader if row])
+
+    def _read_sql(self, source: SourceConfig) -> CursorTable:
+        conn, driver = connect_sql(source.path)
+        try:
+            sql, params = build_sql_query(source, getattr(driver, "paramstyle", "qmark"))
+            # psycopg named cursors stay on the server and stream in arraysize batches.
+            cursor = conn.cursor(name="recon_source") if driver.__name__.startswith("psycopg") else conn.cursor()
+            cursor.arraysize = max(1, source.batch_size)
+            cursor.execute(sql, params)
+            # Named cursors only fill in description once the first batch has been fetched.
+            first = cursor.fetchmany(cursor.arraysize)
+        except BaseException:
+            conn.close()
+            raise
+        header = [col[0] for col in cursor.description or []]
+
+        def batches() -> Iterator[Sequence[Any]]:
+            try:
+                rows = first
+                while rows:
+                    yield from rows
+                    rows = cursor.fetchmany(cursor.arraysize)
+            finally:
+                cursor.close()
+                conn.close()
+
+        return CursorTable(header, batches())
 
     def _read_excel(self, path: str) -> list[dict[str, Any]]:
+        from .xlsx_io import read_simple_xlsx
+
         return read_simple_xlsx(path)
 
     def _read_pdf(self, path: str) -> list[dict[str, Any]]:
+        from .pdf_io import read_simple_pdf_table
+
         return read_simple_pdf_table(path)
 
     def _read_api(self, path_or_url: str) -> list[dict[str, Any]]:
+        return list(self._iter_api(path_or_url))
+
+    def _iter_api(self, path_or_url: str) -> Iterator[dict[str, Any]]:
+        from .json_io import iter_json_array, iter_json_stream
+
         if os.path.exists(path_or_url):
-            with open(path_or_url, "r", encoding="utf-8", errors="ignore") as f:
-                if path_or_url.lower().endswith(".jsonl"):
-                    return [json.loads(line) for line in f if line.strip()]
-                payload = json.load(f)
+            if path_or_url.lower().endswith(".jsonl"):
+                with open(path_or_url, "r", encoding="utf-8", errors="ignore") as f:
+                    yield from (json.loads(line) for line in f if line.strip())
+                return
+            items = iter_json_array(path_or_url)
         else:
-            resp = requests.get(path_or_url, timeout=self.timeout_s)
+            yield from self._fetch_api(path_or_url)
+            return
+        yield from (item if isinstance(item, dict) else dict(item) for item in items)
+
+    def _fetch_api(self, url: str) -> Iterator[dict[str, Any]]:
+        import requests
+
+        from .json_io import iter_json_stream
+
+        cache = self.cache
+        entry = cache.lookup(url) if cache is not None else None
+        headers = cache.conditional_headers(entry) if cache is not None else {}
+        resp = requests.get(url, timeout=self.timeout_s, stream=True, headers=headers)
+        if cache is not None:
+            cache.count("requests")
+        if resp.status_code == 304 and entry is not None:
+            resp.close()
+            cache.count("not_modified")
+            yield from entry["rows"]
+            return
+        with resp:
             resp.raise_for_status()
-            payload = resp.json()
-        if isinstance(payload, list):
-            return [dict(item) for item in payload]
-        if isinstance(payload, dict) and "data" in payload and isinstance(payload["data"], list):
-            return [dict(item) for item in payload["data"]]
-        raise ValueError("API payload must be a list or {data:[...]}")
+            resp.raw.decode_content = True
+            items = iter_json_stream(io.TextIOWrapper(resp.raw, encoding=resp.encoding or "utf-8"))
+            if cache is None:
+                yield from (item if isinstance(item, dict) else dict(item) for item in items)
+                return
+            cache.count("fetched")
+            rows: list[dict[str, Any]] = []
+            for item in items:
+                row = item if isinstance(item, dict) else dict(item)
+                rows.append(row)
+                yield row
+            cache.store(url, resp.headers.get("ETag", ""), resp.headers.get("Last-Modified", ""), rows)
 
     def peek_columns(self, source: SourceConfig, max_rows: int = 50) -> tuple[list[str], int]:
         rows = self.read_source(source)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+from typing import IO, Any, Iterator
+
+from .utils import optional_import
+
+
+CHUNK_SIZE = 1 << 16
+PAYLOAD_ERROR = "API payload must be a list or {data:[...]}"
+_WS = " \t\r\n\ufeff"
+
+
+class _TextCursor:
+    def __init__(self, fp: IO[str], chunk_size: int = CHUNK_SIZE) -> None:
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos > self.chunk_size:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+        self.buf += chunk
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(PAYLOAD_ERROR)
+        self.pos += 1
+
+    def value(self, decoder: json.JSONDecoder) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A bare number or literal cut by the chunk edge may continue in the next chunk.
+            if not isinstance(value, (dict, list, str)) and not self.eof:
+                if end >= len(self.buf) or self.buf[end] not in ",]}" + _WS:
+                    self._fill()
+                    continue
+            self.pos = end
+            return value
+
+
+def _iter_array(cursor: _TextCursor, decoder: json.JSONDecoder) -> Iterator[Any]:
+    cursor.expect("[")
+    if cursor.peek() == "]":
+        cursor.pos += 1
+        return
+    while True:
+        yield cursor.value(decoder)
+        sep = cursor.peek()
+        cursor.pos += 1
+        if sep == "]":
+            return
+        if sep != ",":
+            raise ValueError(PAYLOAD_ERROR)
+
+
+def _iter_stdlib(fp: IO[str], key: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    cursor = _TextCursor(fp, chunk_size)
+    head = cursor.peek()
+    if head == "[":
+        yield from _iter_array(cursor, decoder)
+        return
+    cursor.expect("{")
+    while cursor.peek() not in ("}", ""):
+        name = cursor.value(decoder)
+        cursor.expect(":")
+        if name == key and cursor.peek() == "[":
+            yield from _iter_array(cursor, decoder)
+            return
+        cursor.value(decoder)
+        if cursor.peek() == ",":
+            cursor.pos += 1
+    raise ValueError(PAYLOAD_ERROR)
+
+
+def _iter_ijson(path: str, key: str) -> Iterator[Any]:
+    with open(path, "rb") as f:
+        head = f.peek(64).lstrip(b" \t\r\n\xef\xbb\xbf")[:1]
+        prefix = "item" if head == b"[" else f"{key}.item"
+        found = False
+        for item in optional_import("ijson").items(f, prefix, use_float=True):
+            found = True
+            yield item
+    if not found and head != b"[":
+        # Empty data array or missing envelope: let the stdlib scanner decide which.
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            yield from _iter_stdlib(f, key)
+
+
+def iter_json_array(path: str, key: str = "data") -> Iterator[Any]:
+    if optional_import("ijson") is not None:
+        yield from _iter_ijson(path, key)
+        return
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        yield from _iter_stdlib(f, key)
+
+
+def iter_json_stream(fp: IO[str], key: str = "data", chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    return _iter_stdlib(fp, key, chunk_size)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from typing import Any, Iterable
+
+from .matching import sorted_tokens, token_similarity
+from .utils import clean_string, normalize_email, normalize_phone
+
+
+INDEX_FILENAME = "entity_index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE golden (group_id TEXT PRIMARY KEY, record TEXT NOT NULL);
+CREATE TABLE id_keys (field TEXT NOT NULL, value TEXT NOT NULL, group_id TEXT NOT NULL);
+CREATE TABLE names (group_id TEXT NOT NULL, name_tokens TEXT NOT NULL);
+CREATE TABLE name_tokens (token TEXT NOT NULL, group_id TEXT NOT NULL);
+"""
+_INDEXES = """
+CREATE INDEX id_keys_lookup ON id_keys (field, value);
+CREATE INDEX name_tokens_lookup ON name_tokens (token);
+"""
+
+
+def normalize_key(field: str, value: Any) -> str:
+    if field == "email":
+        return normalize_email(value)
+    if field == "phone":
+        return normalize_phone(value)
+    return clean_string(value).casefold()
+
+
+def write_entity_index(
+    path: str,
+    entries: Iterable[tuple[str, list[dict[str, Any]], dict[str, Any]]],
+    id_columns: list[str],
+) -> None:
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        for group_id, records, golden in entries:
+            conn.execute(
+                "INSERT INTO golden VALUES (?, ?)", (group_id, json.dumps(golden, default=str))
+            )
+            keys = {
+                (field, normalize_key(field, rec.get(field, "")))
+                for rec in records
+                for field in id_columns
+            }
+            conn.executemany(
+                "INSERT INTO id_keys VALUES (?, ?, ?)",
+                [(field, value, group_id) for field, value in keys if value],
+            )
+            names = {sorted_tokens(rec.get("name", "")) for rec in records} - {""}
+            conn.executemany("INSERT INTO names VALUES (?, ?)", [(group_id, n) for n in names])
+            tokens = {token for n in names for token in n.split()}
+            conn.executemany("INSERT INTO name_tokens VALUES (?, ?)", [(t, group_id) for t in tokens])
+        conn.executescript(_INDEXES)
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+
+
+class EntityLookup:
+    def __init__(self, path: str) -> None:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Entity index not found: {path}")
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "EntityLookup":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def lookup(self, field: str, value: Any) -> dict[str, Any] | None:
+        row = self.conn.execute(
+            "SELECT g.group_id, g.record FROM id_keys k JOIN golden g ON g.group_id = k.group_id "
+            "WHERE k.field = ? AND k.value = ? LIMIT 1",
+            (field, normalize_key(field, value)),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"group_id": row[0], "golden": json.loads(row[1])}
+
+    def search_name(self, name: str, limit: int = 5, min_score: float = 0.8) -> list[dict[str, Any]]:
+        query = sorted_tokens(name)
+        tokens = sorted(set(query.split()))
+        if not tokens:
+            return []
+        placeholders = ",".join("?" * len(tokens))
+        rows = self.conn.execute(
+            "SELECT DISTINCT n.group_id, n.name_tokens FROM name_tokens t "
+            f"JOIN names n ON n.group_id = t.group_id WHERE t.token IN ({placeholders})",
+            tokens,
+        ).fetchall()
+        best: dict[str, float] = {}
+        for group_id, candidate in rows:
+            score = token_similarity(query, candidate)
+            if score >= min_score and score > best.get(group_id, -1.0):
+                best[group_id] = score
+        ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        out = []
+        for group_id, score in ranked:
+            record = self.conn.execute(
+                "SELECT record FROM golden WHERE group_id = ?", (group_id,)
+            ).fetchone()[0]
+            out.append({"group_id": group_id, "score": round(score, 4), "golden": json.loads(record)})
+        return out
@@ -1,111 +1,605 @@
 from __future__ import annotations
 
+import linecache
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
-from typing import Any
+from typing import Any, Callable, Collection, Iterable, Iterator
 
-try:
-    from rapidfuzz import fuzz  # type: ignore
-except Exception:  # pragma: no cover
-    fuzz = None
+from .config import MatchLimits, MatchRules
+from .utils import clean_string, optional_import, parse_date, stable_fingerprint, to_float
+
+
+# False until first use, then the rapidfuzz.fuzz module or None; resolved lazily to keep startup cheap.
+_fuzz: Any = False
+
+
+def _load_fuzz() -> Any:
+    global _fuzz
+    _fuzz = optional_import("rapidfuzz.fuzz")
+    return _fuzz
 
 
 def similarity(a: str, b: str) -> float:
     if not a or not b:
         return 0.0
+    fuzz = _fuzz if _fuzz is not False else _load_fuzz()
     if fuzz is not None:
         return float(fuzz.token_sort_ratio(a, b)) / 100.0
     return SequenceMatcher(a=a.lower(), b=b.lower()).ratio()
 
 
-def canonical_entity_key(record: dict[str, Any]) -> str:
+def canonical_entity_key(record: dict[str, Any], skip: Collection[str] = ()) -> str:
     for key in ("customer_id", "email", "phone"):
         value = str(record.get(key, "")).strip()
-        if value:
+        if value and f"{key}:{value}" not in skip:
             return f"{key}:{value}"
     name = str(record.get("name", "")).strip().lower()
     dob = str(record.get("dob", "")).strip()
-    if name and dob:
+    if name and dob and f"name_dob:{name}:{dob}" not in skip:
         return f"name_dob:{name}:{dob}"
-    return f"fallback:{hash((name, str(record.get('address', '')).lower()))}"
+    return f"fallback:{stable_fingerprint(name, str(record.get('address', '')).lower()).hex()}"
+
+
+ANCHOR_PREFIXES = ("customer_id:", "email:", "phone:", "name_dob:")
+
 
+def stable_group_id(records: list[dict[str, Any]], skip: Collection[str] = ()) -> str:
+    keys = [canonical_entity_key(rec, skip) for rec in records]
+    anchor = ""
+    for prefix in ANCHOR_PREFIXES:
+        candidates = [k for k in keys if k.startswith(prefix)]
+        if candidates:
+            anchor = min(candidates)
+            break
+    if not anchor:
+        anchor = "fallback:" + min(
+            f"{str(rec.get('name', '')).strip().lower()}|{str(rec.get('address', '')).lower()}"
+            for rec in records
+        )
+    return "G" + stable_fingerprint(anchor, digest_size=6).hex()
 
-def cluster_records(records: list[dict[str, Any]], threshold: float) -> dict[str, list[dict[str, Any]]]:
-    groups: dict[str, list[dict[str, Any]]] = {}
-    leftovers: list[dict[str, Any]] = []
 
+FINGERPRINT_EXCLUDED = ("source_name", "source_row")
+
+
+def record_fingerprint(record: dict[str, Any], exclude: Collection[str] = FINGERPRINT_EXCLUDED) -> bytes:
+    items = sorted((k, v) for k, v in record.items() if k not in exclude and v not in ("", None))
+    return stable_fingerprint(repr(items), digest_size=16)
+
+
+def collapse_exact_duplicates(
+    records: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], dict[int, list[dict[str, Any]]]]:
+    first_seen: dict[bytes, dict[str, Any]] = {}
+    copies: dict[int, list[dict[str, Any]]] = {}
+    representatives: list[dict[str, Any]] = []
     for rec in records:
-        key = canonical_entity_key(rec)
+        fingerprint = record_fingerprint(rec)
+        rep = first_seen.get(fingerprint)
+        if rep is None:
+            first_seen[fingerprint] = rec
+            representatives.append(rec)
+        else:
+            copies.setdefault(id(rep), []).append(rec)
+    return representatives, copies
+
+
+def duplicate_weights(copies: dict[int, list[dict[str, Any]]]) -> dict[int, int]:
+    return {rep_id: 1 + len(recs) for rep_id, recs in copies.items()}
+
+
+def expand_exact_duplicates(
+    groups: dict[str, list[dict[str, Any]]], copies: dict[int, list[dict[str, Any]]]
+) -> dict[str, list[dict[str, Any]]]:
+    if not copies:
+        return groups
+    expanded: dict[str, list[dict[str, Any]]] = {}
+    for key, members in groups.items():
+        out: list[dict[str, Any]] = []
+        for rec in members:
+            out.append(rec)
+            out.extend(copies.get(id(rec), ()))
+        expanded[key] = out
+    return expanded
+
+
+REPRESENTATIVE_FIELDS = ("customer_id", "email", "phone", "name", "dob")
+
+
+@dataclass(frozen=True)
+class MatchFeatures:
+    name_tokens: str
+    email: str
+    email_local: str
+    phone: str
+    dob: str
+    richness: int
+
+
+def sorted_tokens(value: Any) -> str:
+    return " ".join(sorted(str(value or "").lower().split()))
+
+
+def _match_text(value: Any, fuzz: Any) -> str:
+    # Precomputed inputs of similarity(): fuzz.ratio on sorted tokens equals token_sort_ratio (case
+    # sensitive), while the difflib path compares the lowercased strings.
+    text = str(value or "")
+    if fuzz is None:
+        return text.lower()
+    return " ".join(sorted(text.split()))
+
+
+def match_features(record: dict[str, Any], hot_keys: Collection[str] = ()) -> MatchFeatures:
+    fuzz = _fuzz if _fuzz is not False else _load_fuzz()
+    email = _match_text(record.get("email", ""), fuzz)
+    phone = str(record.get("phone", "") or "")
+    if hot_keys:
+        # Placeholder identifiers shared by a hot key must not count as evidence of a match.
+        if f"email:{str(record.get('email', '')).strip()}" in hot_keys:
+            email = ""
+        if f"phone:{phone.strip()}" in hot_keys:
+            phone = ""
+    return MatchFeatures(
+        name_tokens=_match_text(record.get("name", ""), fuzz),
+        email=email,
+        email_local=email.split("@", 1)[0],
+        phone=phone,
+        dob=str(record.get("dob", "") or ""),
+        richness=sum(1 for k in REPRESENTATIVE_FIELDS if record.get(k)),
+    )
+
+
+def token_similarity(a: str, b: str) -> float:
+    if not a or not b:
+        return 0.0
+    fuzz = _fuzz if _fuzz is not False else _load_fuzz()
+    if fuzz is not None:
+        return float(fuzz.ratio(a, b)) / 100.0
+    return SequenceMatcher(a=a, b=b).ratio()
+
+
+def _sequence_ratio(a: str, b: str, cutoff: float) -> float:
+    matcher = SequenceMatcher(a=a, b=b)
+    if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+        return 0.0
+    return matcher.ratio()
+
+
+class _Group:
+    __slots__ = ("members", "probe", "rep")
+
+    def __init__(self, record: dict[str, Any], features: MatchFeatures) -> None:
+        self.members = [record]
+        self.probe = features
+        self.rep = features
+
+    def add(self, record: dict[str, Any], features: MatchFeatures) -> None:
+        self.members.append(record)
+        if features.richness > self.rep.richness:
+            self.rep = features
+
+    def absorb(self, other: "_Group") -> None:
+        self.members.extend(other.members)
+        if other.rep.richness > self.rep.richness:
+            self.rep = other.rep
+
+
+@dataclass
+class ClusterReport:
+    hot_keys: dict[str, int] = field(default_factory=dict)
+    hot_blocks: dict[str, int] = field(default_factory=dict)
+    comparisons: int = 0
+    budget_exhausted: int = 0
+    candidates_truncated: int = 0
+    rule_fires: dict[str, int] = field(default_factory=dict)
+
+
+MATCH_FEATURE_FIELDS = {
+    "name": "name_tokens",
+    "email": "email",
+    "email_local": "email_local",
+    "phone": "phone",
+    "dob": "dob",
+}
+MATCH_OP_COSTS = {"equal": 1, "similar": 10}
+
+
+class MatchPlan:
+    # Rules are OR-ed conjunctions. Conditions run cheapest first, and rules that can be rejected by
+    # an exact check run before pure similarity rules. The plan is generated as one Python function
+    # so a pair costs no more than the hand-written predicates it replaces.
+    def __init__(self, rules: list[dict[str, Any]], threshold: float, stage: str) -> None:
+        # rules are already checked by config.validate_match_rules.
+        ordered = []
+        for position, rule in enumerate(rules):
+            steps = []
+            for cond in rule["all"]:
+                cutoff = cond["min"] if "min" in cond else threshold + cond["offset"]
+                attr = MATCH_FEATURE_FIELDS[cond["field"]]
+                steps.append((MATCH_OP_COSTS[cond["op"]], attr, cond["op"] == "equal", cutoff))
+            steps.sort(key=lambda step: step[0])
+            ordered.append(((steps[0][0], sum(step[0] for step in steps), position), rule["name"], steps))
+        ordered.sort(key=lambda item: item[0])
+        self.rules = [(f"{stage}:{name}", [step[1:] for step in steps]) for _, name, steps in ordered]
+        fuzz = _fuzz if _fuzz is not False else _load_fuzz()
+        self.source = _plan_source(self.rules, scaled=fuzz is not None)
+        namespace = {"ratio": fuzz.ratio if fuzz is not None else _sequence_ratio}
+        filename = f"<{stage} match plan {stable_fingerprint(self.source).hex()}>"
+        # Registered with linecache so tracebacks and pdb show the generated lines.
+        linecache.cache[filename] = (len(self.source), None, self.source.splitlines(True), filename)
+        exec(compile(self.source, filename, "exec"), namespace)
+        self.first_match: Callable[[MatchFeatures, MatchFeatures], str | None] = namespace["first_match"]
+
+
+def _plan_source(rules: list[tuple[str, list[tuple[str, bool, float]]]], scaled: bool) -> str:
+    used = sorted({attr for _, checks in rules for attr, _, _ in checks})
+    scored = sorted({attr for _, checks in rules for attr, exact, cutoff in checks if not exact and cutoff > 0})
+    lines = ["def first_match(a, b):"]
+    lines += [f"    a_{attr} = a.{attr}\n    b_{attr} = b.{attr}" for attr in used]
+    # s_<field> holds the score; 0.0 after a cutoff only proves it is below c_<field>.
+    lines += [f"    s_{attr} = -1.0\n    c_{attr} = 2.0" for attr in scored]
+    for name, checks in rules:
+        indent = "    "
+        for attr, exact, cutoff in checks:
+            if exact:
+                lines.append(f"{indent}if a_{attr} and a_{attr} == b_{attr}:")
+                indent += "    "
+                continue
+            if cutoff <= 0:
+                continue
+            if scaled:
+                # Nudged down so float rounding at the boundary never rejects an accepted score.
+                call = f"ratio(a_{attr}, b_{attr}, score_cutoff={cutoff * 100.0 - 1e-6!r}) / 100.0"
+            else:
+                call = f"ratio(a_{attr}, b_{attr}, {cutoff!r})"
+            lines.append(f"{indent}if s_{attr} < 0.0 or (s_{attr} == 0.0 and c_{attr} > {cutoff!r}):")
+            lines.append(f"{indent}    s_{attr} = {call} if a_{attr} and b_{attr} else 0.0")
+            lines.append(f"{indent}    c_{attr} = {cutoff!r}")
+            lines.append(f"{indent}if s_{attr} >= {cutoff!r}:")
+            indent += "    "
+        lines.append(f"{indent}return {name!r}")
+    lines.append("    return None")
+    return "\n".join(lines) + "\n"
+
+
+def _count_fire(fires: dict[str, int], rule: str) -> None:
+    fires[rule] = fires.get(rule, 0) + 1
+
+
+class _BlockIndex:
+    def __init__(self, max_block_size: int, report: ClusterReport) -> None:
+        self.max_block_size = max_block_size
+        self.report = report
+        self.blocks: dict[str, list[str]] = {}
+        self.rank: dict[str, int] = {}
+
+    def add(self, key: str, terms: list[str]) -> None:
+        self.rank.setdefault(key, len(self.rank))
+        for term in terms:
+            self.blocks.setdefault(term, []).append(key)
+
+    def candidates(self, terms: list[str]) -> list[str]:
+        found: set[str] = set()
+        for term in terms:
+            block = self.blocks.get(term)
+            if not block:
+                continue
+            if self.max_block_size and len(block) > self.max_block_size:
+                self.report.hot_blocks[term] = len(block)
+                continue
+            found.update(block)
+        return sorted(found, key=self.rank.__getitem__)
+
+
+def _detect_hot_keys(
+    records: list[dict[str, Any]], max_key_size: int, report: ClusterReport, weights: dict[int, int]
+) -> tuple[list[str], set[str]]:
+    keys = [canonical_entity_key(rec) for rec in records]
+    hot: set[str] = set()
+    if max_key_size <= 0:
+        return keys, hot
+    while True:
+        counts: dict[str, int] = {}
+        for rec, key in zip(records, keys):
+            counts[key] = counts.get(key, 0) + weights.get(id(rec), 1)
+        fresh = {
+            k for k, c in counts.items() if c > max_key_size and not k.startswith("fallback:") and k not in hot
+        }
+        if not fresh:
+            return keys, hot
+        for key in fresh:
+            report.hot_keys[key] = counts[key]
+        hot |= fresh
+        keys = [canonical_entity_key(rec, hot) if key in fresh else key for rec, key in zip(records, keys)]
+
+
+def _capped(candidates: Iterable[str], limits: MatchLimits, report: ClusterReport) -> Iterator[str]:
+    for i, key in enumerate(candidates):
+        if limits.candidate_cap and i >= limits.candidate_cap:
+            report.candidates_truncated += 1
+            return
+        yield key
+
+
+def cluster_records(
+    records: list[dict[str, Any]],
+    threshold: float,
+    limits: MatchLimits | None = None,
+    report: ClusterReport | None = None,
+    rules: MatchRules | None = None,
+    weights: dict[int, int] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    # weights maps id(record) to how many identical records it stands for (see collapse_exact_duplicates).
+    weights = weights or {}
+    limits = limits or MatchLimits()
+    report = report if report is not None else ClusterReport()
+    rules = rules or MatchRules()
+    place = MatchPlan(rules.place, threshold, "place")
+    groups: dict[str, _Group] = {}
+    leftovers: list[tuple[dict[str, Any], MatchFeatures]] = []
+
+    keys, hot = _detect_hot_keys(records, limits.max_key_size, report, weights)
+    for rec, key in zip(records, keys):
+        features = match_features(rec, hot)
         if key.startswith("fallback:"):
-            leftovers.append(rec)
+            leftovers.append((rec, features))
             continue
-        groups.setdefault(key, []).append(rec)
+        group = groups.get(key)
+        if group is None:
+            groups[key] = _Group(rec, features)
+        else:
+            group.add(rec, features)
 
-    for rec in leftovers:
+    blocked = limits.strategy == "blocked"
+    probes = _BlockIndex(limits.max_block_size, report)
+    if blocked:
+        for key, group in groups.items():
+            probes.add(key, _name_terms(group.probe))
+    budget = limits.comparison_budget
+    for rec, features in leftovers:
         placed = False
-        for k, members in groups.items():
-            probe = members[0]
-            score = similarity(rec.get("name", ""), probe.get("name", ""))
-            same_dob = rec.get("dob", "") and rec.get("dob", "") == probe.get("dob", "")
-            if score >= threshold and (same_dob or score >= threshold + 0.05):
-                members.append(rec)
+        candidates = probes.candidates(_name_terms(features)) if blocked else groups
+        used = 0
+        for key in _capped(candidates, limits, report):
+            if budget and used >= budget:
+                report.budget_exhausted += weights.get(id(rec), 1)
+                break
+            used += 1
+            group = groups[key]
+            fired = place.first_match(features, group.probe)
+            if fired is not None:
+                _count_fire(report.rule_fires, fired)
+                group.add(rec, features)
                 placed = True
                 break
+        report.comparisons += used
         if not placed:
-            groups[canonical_entity_key(rec)] = [rec]
-    groups = _merge_similar_groups(groups, threshold)
-    return groups
-
-
-def _representative(record_list: list[dict[str, Any]]) -> dict[str, Any]:
-    return max(
-        record_list,
-        key=lambda r: sum(1 for k in ("customer_id", "email", "phone", "name", "dob") if r.get(k)),
-    )
-
-
-def _should_merge_groups(a: list[dict[str, Any]], b: list[dict[str, Any]], threshold: float) -> bool:
-    ra = _representative(a)
-    rb = _representative(b)
-    name_score = similarity(ra.get("name", ""), rb.get("name", ""))
-    email_score = similarity(ra.get("email", ""), rb.get("email", ""))
-    same_phone = ra.get("phone", "") and ra.get("phone", "") == rb.get("phone", "")
-    same_dob = ra.get("dob", "") and ra.get("dob", "") == rb.get("dob", "")
-    if same_phone and name_score >= threshold - 0.1:
-        return True
-    if same_dob and (name_score >= threshold or email_score >= threshold - 0.05):
-        return True
-    return name_score >= threshold + 0.05 and email_score >= threshold - 0.05
+            key = canonical_entity_key(rec)
+            if key in groups:
+                key = f"{key}#{len(groups)}"
+            groups[key] = _Group(rec, features)
+            if blocked:
+                probes.add(key, _name_terms(features))
+    merged = _merge_similar_groups(groups, MatchPlan(rules.merge, threshold, "merge"), limits, report)
+    return {key: group.members for key, group in merged.items()}
 
 
 def _merge_similar_groups(
-    groups: dict[str, list[dict[str, Any]]], threshold: float
-) -> dict[str, list[dict[str, Any]]]:
+    groups: dict[str, _Group],
+    plan: MatchPlan,
+    limits: MatchLimits | None = None,
+    report: ClusterReport | None = None,
+) -> dict[str, _Group]:
+    limits = limits or MatchLimits()
+    report = report if report is not None else ClusterReport()
     keys = list(groups.keys())
+    blocked = limits.strategy == "blocked"
+    reps = _BlockIndex(limits.max_block_size, report)
+    if blocked:
+        for key in keys:
+            reps.add(key, _index_terms(groups[key].rep))
+    budget = limits.comparison_budget
     consumed: set[str] = set()
-    merged: dict[str, list[dict[str, Any]]] = {}
+    merged: dict[str, _Group] = {}
     for i, key in enumerate(keys):
         if key in consumed:
             continue
-        base = list(groups[key])
-        for j in range(i + 1, len(keys)):
-            other_key = keys[j]
+        base = groups[key]
+        if blocked:
+            candidates: Iterable[str] = (k for k in reps.candidates(_index_terms(base.rep)) if reps.rank[k] > i)
+        else:
+            candidates = (keys[j] for j in range(i + 1, len(keys)))
+        used = 0
+        for other_key in _capped(candidates, limits, report):
             if other_key in consumed:
                 continue
-            if _should_merge_groups(base, groups[other_key], threshold):
-                base.extend(groups[other_key])
+            if budget and used >= budget:
+                report.budget_exhausted += 1
+                break
+            used += 1
+            fired = plan.first_match(base.rep, groups[other_key].rep)
+            if fired is not None:
+                _count_fire(report.rule_fires, fired)
+                base.absorb(groups[other_key])
                 consumed.add(other_key)
+        report.comparisons += used
         merged[key] = base
     return merged
 
 
-def detect_field_mismatches(records: list[dict[str, Any]], critical_fields: list[str]) -> dict[str, list[Any]]:
+class IncrementalClusterer:
+    def __init__(
+        self, threshold: float, rules: MatchRules | None = None, hot_keys: Collection[str] = ()
+    ) -> None:
+        rules = rules or MatchRules()
+        self.threshold = threshold
+        # Hot keys found by the initial clustering stay out of keying and matching on upserts.
+        self.hot_keys = set(hot_keys)
+        self.place = MatchPlan(rules.place, threshold, "place")
+        self.merge = MatchPlan(rules.merge, threshold, "merge")
+        self.rule_fires: dict[str, int] = {}
+        self.groups: dict[str, _Group] = {}
+        self._key_owner: dict[str, str] = {}
+        self._index: dict[str, set[str]] = {}
+        self._rank: dict[str, int] = {}
+
+    @classmethod
+    def from_groups(
+        cls,
+        groups: dict[str, list[dict[str, Any]]],
+        threshold: float,
+        rules: MatchRules | None = None,
+        hot_keys: Collection[str] = (),
+    ) -> "IncrementalClusterer":
+        clusterer = cls(threshold, rules, hot_keys)
+        hot = clusterer.hot_keys
+        for key, members in groups.items():
+            for i, rec in enumerate(members):
+                if i == 0:
+                    clusterer._create(key, rec, match_features(rec, hot))
+                else:
+                    clusterer._attach(key, rec, match_features(rec, hot))
+                rec_key = canonical_entity_key(rec, hot)
+                if not rec_key.startswith("fallback:"):
+                    clusterer._key_owner.setdefault(rec_key, key)
+        return clusterer
+
+    def add(self, record: dict[str, Any]) -> str:
+        features = match_features(record, self.hot_keys)
+        key = canonical_entity_key(record, self.hot_keys)
+        fallback = key.startswith("fallback:")
+        owner = self._key_owner.get(key) if not fallback else None
+        if owner is None and key in self.groups:
+            owner = key
+        if owner is not None:
+            self._attach(owner, record, features)
+            return owner
+
+        candidates = self._candidates(features)
+        if fallback:
+            for group_key in candidates:
+                fired = self.place.first_match(features, self.groups[group_key].probe)
+                if fired is not None:
+                    _count_fire(self.rule_fires, fired)
+                    self._attach(group_key, record, features)
+                    return group_key
+
+        for group_key in candidates:
+            fired = self.merge.first_match(self.groups[group_key].rep, features)
+            if fired is not None:
+                _count_fire(self.rule_fires, fired)
+                self._attach(group_key, record, features)
+                if not fallback:
+                    self._key_owner[key] = group_key
+                return group_key
+        self._create(key, record, features)
+        if not fallback:
+            self._key_owner[key] = key
+        return key
+
+    def members(self, group_key: str) -> list[dict[str, Any]]:
+        return self.groups[group_key].members
+
+    def _candidates(self, features: MatchFeatures) -> list[str]:
+        found: set[str] = set()
+        for term in _index_terms(features):
+            found.update(self._index.get(term, ()))
+        return sorted(found, key=self._rank.__getitem__)
+
+    def _create(self, key: str, record: dict[str, Any], features: MatchFeatures) -> None:
+        self.groups[key] = _Group(record, features)
+        self._rank[key] = len(self._rank)
+        self._register(key, features)
+
+    def _attach(self, key: str, record: dict[str, Any], features: MatchFeatures) -> None:
+        self.groups[key].add(record, features)
+        self._register(key, features)
+
+    def _register(self, key: str, features: MatchFeatures) -> None:
+        for term in _index_terms(features):
+            self._index.setdefault(term, set()).add(key)
+
+
+def _name_terms(features: MatchFeatures) -> list[str]:
+    return [f"t:{token}" for token in set(features.name_tokens.lower().split())]
+
+
+def _index_terms(features: MatchFeatures) -> list[str]:
+    terms = _name_terms(features)
+    if features.phone:
+        terms.append(f"p:{features.phone}")
+    if features.dob:
+        terms.append(f"d:{features.dob}")
+    if features.email:
+        terms.append(f"e:{features.email.lower()}")
+    return terms
+
+
+FIELD_COMPARATORS: dict[str, str] = {
+    "amount": "numeric",
+    "dob": "date",
+    "date": "date",
+    "updated_at": "date",
+}
+
+
+def _distinct_numeric(values: list[Any], tolerance: float) -> list[Any]:
+    out: list[Any] = []
+    buckets: dict[float, list[float]] = {}
+    seen_text: set[str] = set()
+    for value in values:
+        number = to_float(value)
+        if number is None:
+            key = clean_string(value).casefold()
+            if key not in seen_text:
+                seen_text.add(key)
+                out.append(value)
+            continue
+        if tolerance <= 0:
+            if number not in buckets:
+                buckets[number] = [number]
+                out.append(value)
+            continue
+        slot = round(number / tolerance)
+        if any(
+            abs(number - other) <= tolerance
+            for near in (slot - 1, slot, slot + 1)
+            for other in buckets.get(near, ())
+        ):
+            continue
+        buckets.setdefault(slot, []).append(number)
+        out.append(value)
+    return out
+
+
+def _distinct_keyed(values: list[Any], kind: str) -> list[Any]:
+    out: list[Any] = []
+    seen: set[str] = set()
+    for value in values:
+        key = parse_date(value) if kind == "date" else clean_string(value).casefold()
+        if key not in seen:
+            seen.add(key)
+            out.append(value)
+    return out
+
+
+def detect_field_mismatches(
+    records: list[dict[str, Any]],
+    critical_fields: list[str],
+    numeric_tolerance: float = 0.005,
+) -> dict[str, list[Any]]:
+    if len(records) < 2:
+        return {}
     mismatches: dict[str, list[Any]] = {}
     for field in critical_fields:
-        values = []
-        for rec in records:
-            value = rec.get(field, "")
-            if value not in ("", None) and value not in values:
-                values.append(value)
+        present = [v for v in (rec.get(field, "") for rec in records) if v not in ("", None)]
+        if len(present) < 2:
+            continue
+        kind = FIELD_COMPARATORS.get(field, "text")
+        if kind == "numeric":
+            values = _distinct_numeric(present, numeric_tolerance)
+        else:
+            values = _distinct_keyed(present, kind)
         if len(values) > 1:
             mismatches[field] = values
     return mismatches
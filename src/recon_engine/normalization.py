@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable, Sequence
 
 from .utils import (
     clean_string,
     detect_currency,
+    detect_currency_batch,
     normalize_email,
     normalize_phone,
+    normalize_phone_batch,
     parse_date,
     to_float,
+    to_float_batch,
 )
 
 
@@ -54,14 +57,23 @@ def build_alias_lookup(
     return out
 
 
-def normalize_record(
+def resolve_header(header: list[str], alias_lookup: dict[str, str]) -> list[str]:
+    targets = []
+    for column in header:
+        key = column.lower().strip()
+        targets.append(alias_lookup.get(key, key))
+    return targets
+
+
+BATCH_CHUNK_SIZE = 50_000
+
+
+def map_record(
     record: dict[str, Any],
     source_name: str,
-    row_num: int,
-    global_aliases: dict[str, list[str]] | None = None,
-    source_field_map: dict[str, str] | None = None,
+    row_num: int | str,
+    alias_lookup: dict[str, str],
 ) -> dict[str, Any]:
-    alias_lookup = build_alias_lookup(global_aliases, source_field_map)
     canon: dict[str, Any] = {
         "source_name": source_name,
         "source_row": row_num,
@@ -69,19 +81,91 @@ def normalize_record(
     for key, value in record.items():
         target = alias_lookup.get(key.lower().strip(), key.lower().strip())
         canon[target] = value
+    return canon
+
+
+def normalize_record(
+    record: dict[str, Any],
+    source_name: str,
+    row_num: int | str,
+    global_aliases: dict[str, list[str]] | None = None,
+    source_field_map: dict[str, str] | None = None,
+    alias_lookup: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    if alias_lookup is None:
+        alias_lookup = build_alias_lookup(global_aliases, source_field_map)
+    return _normalize_fields(map_record(record, source_name, row_num, alias_lookup))
+
+
+def build_row_mapper(
+    header: list[str],
+    source_name: str,
+    alias_lookup: dict[str, str],
+) -> Callable[[Sequence[Any], int | str], dict[str, Any]]:
+    targets = resolve_header(header, alias_lookup)
+    width = len(targets)
+
+    def map_row(values: Sequence[Any], row_num: int | str) -> dict[str, Any]:
+        canon: dict[str, Any] = {
+            "source_name": source_name,
+            "source_row": row_num,
+        }
+        if len(values) < width:
+            values = list(values) + [None] * (width - len(values))
+        for target, value in zip(targets, values):
+            canon[target] = value
+        return canon
+
+    return map_row
+
+
+def build_row_normalizer(
+    header: list[str],
+    source_name: str,
+    alias_lookup: dict[str, str],
+) -> Callable[[Sequence[Any], int | str], dict[str, Any]]:
+    map_row = build_row_mapper(header, source_name, alias_lookup)
+
+    def normalize_row(values: Sequence[Any], row_num: int | str) -> dict[str, Any]:
+        return _normalize_fields(map_row(values, row_num))
 
+    return normalize_row
+
+
+def normalize_batch(
+    canons: list[dict[str, Any]], chunk_size: int = BATCH_CHUNK_SIZE
+) -> list[dict[str, Any]]:
+    for start in range(0, len(canons), chunk_size):
+        chunk = canons[start : start + chunk_size]
+        amounts_raw = [canon.get("amount", "") for canon in chunk]
+        amounts = to_float_batch(amounts_raw)
+        currencies = detect_currency_batch(amounts_raw)
+        phones = normalize_phone_batch([canon.get("phone", "") for canon in chunk])
+        for canon, amount, currency, phone in zip(chunk, amounts, currencies, phones):
+            _normalize_fields(canon, (phone, amount, currency))
+    return canons
+
+
+def _normalize_fields(
+    canon: dict[str, Any], batched: tuple[str, float | None, str] | None = None
+) -> dict[str, Any]:
     canon["customer_id"] = clean_string(canon.get("customer_id", ""))
     canon["name"] = clean_string(canon.get("name", "")).title()
     canon["email"] = normalize_email(canon.get("email", ""))
-    canon["phone"] = normalize_phone(canon.get("phone", ""))
+    amount_raw = canon.get("amount", "")
+    if batched is None:
+        phone = normalize_phone(canon.get("phone", ""))
+        amount = to_float(amount_raw)
+        detected = None
+    else:
+        phone, amount, detected = batched
+    canon["phone"] = phone
     canon["address"] = clean_string(canon.get("address", "")).title()
     canon["dob"] = parse_date(canon.get("dob", ""))
     canon["updated_at"] = parse_date(canon.get("updated_at", ""))
 
-    amount_raw = canon.get("amount", "")
-    amount = to_float(amount_raw)
     canon["amount"] = "" if amount is None else round(amount, 2)
-    canon["currency"] = clean_string(canon.get("currency", "")) or detect_currency(amount_raw)
+    canon["currency"] = clean_string(canon.get("currency", "")) or detected or detect_currency(amount_raw)
     canon["status"] = clean_string(canon.get("status", "")).lower()
     canon["notes"] = clean_string(canon.get("notes", ""))
     return canon
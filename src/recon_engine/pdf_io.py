@@ -1,13 +1,11 @@
 from __future__ import annotations
 
+import mmap
 import os
 import re
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-try:
-    import pdfplumber  # type: ignore
-except Exception:  # pragma: no cover
-    pdfplumber = None
+from .utils import optional_import
 
 
 def write_simple_pdf_table(path: str, headers: list[str], rows: list[dict[str, Any]]) -> None:
@@ -65,14 +63,45 @@ def _infer_delimiter(line: str) -> str:
     return best if scores[best] > 0 else "|"
 
 
-def _parse_delimited_lines(lines: list[str], delimiter: str | None = None) -> list[dict[str, str]]:
-    trimmed = [l.strip() for l in lines if l and l.strip()]
-    if not trimmed:
-        return []
-    delim = delimiter or _infer_delimiter(trimmed[0])
-    header_line = next((l for l in trimmed if l.count(delim) >= 2), trimmed[0])
+_TEXT_RUN = re.compile(rb"\((.*?)\)\s*Tj", flags=re.DOTALL)
+_TEXT_LINE = re.compile(rb"[^\r\n\x0b\x0c]+")
+
+
+def _iter_mapped_matches(path: str, pattern: re.Pattern[bytes], group: int = 0) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            scanner = pattern.finditer(mm)
+            try:
+                for match in scanner:
+                    yield match.group(group)
+            finally:
+                # The scanner pins the mapping's buffer; drop it before the map closes.
+                del scanner
+
+
+def _parse_delimited_lines(lines: Iterable[str], delimiter: str | None = None) -> list[dict[str, str]]:
+    stripped = (l.strip() for l in lines if l)
+    trimmed = (l for l in stripped if l)
+    pending: list[str] = []
+    delim = delimiter or None
+    header_line = None
+    for line in trimmed:
+        if delim is None:
+            delim = _infer_delimiter(line)
+        if line.count(delim) >= 2:
+            header_line = line
+            break
+        pending.append(line)
+    if header_line is None:
+        if not pending:
+            return []
+        header_line = pending[0]
+        data_lines: Iterable[str] = iter(pending[1:])
+    else:
+        data_lines = trimmed
     headers = [h.strip().lower() for h in header_line.split(delim)]
-    data_lines = trimmed[trimmed.index(header_line) + 1 :]
 
     out: list[dict[str, str]] = []
     for line in data_lines:
@@ -92,23 +121,24 @@ def _parse_delimited_lines(lines: list[str], delimiter: str | None = None) -> li
     return out
 
 
-def _extract_text_runs_from_pdf_bytes(path: str) -> list[str]:
-    with open(path, "rb") as f:
-        data = f.read().decode("latin-1", errors="ignore")
-    text_runs = re.findall(r"\((.*?)\)\s*Tj", data, flags=re.DOTALL)
-    return [
-        t.replace(r"\(", "(").replace(r"\)", ")").replace(r"\\", "\\")
-        for t in text_runs
-    ]
+def _extract_text_runs_from_pdf_bytes(path: str) -> Iterator[str]:
+    for run in _iter_mapped_matches(path, _TEXT_RUN, group=1):
+        text = run.decode("latin-1")
+        yield text.replace(r"\(", "(").replace(r"\)", ")").replace(r"\\", "\\")
+
+
+def _iter_text_lines(path: str) -> Iterator[str]:
+    for line in _iter_mapped_matches(path, _TEXT_LINE):
+        yield line.decode("utf-8", errors="ignore")
 
 
 def read_simple_pdf_table(path: str, delimiter: str = "|") -> list[dict[str, str]]:
     ext = os.path.splitext(path)[1].lower()
     if ext in (".txt", ".tsv", ".csv"):
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            return _parse_delimited_lines(f.read().splitlines(), delimiter=None)
+        return _parse_delimited_lines(_iter_text_lines(path), delimiter=None)
 
     lines: list[str] = []
+    pdfplumber = optional_import("pdfplumber")
     if pdfplumber is not None:
         try:
             with pdfplumber.open(path) as pdf:
@@ -118,5 +148,5 @@ def read_simple_pdf_table(path: str, delimiter: str = "|") -> list[dict[str, str
         except Exception:
             lines = []
     if not lines:
-        lines = _extract_text_runs_from_pdf_bytes(path)
+        return _parse_delimited_lines(_extract_text_runs_from_pdf_bytes(path), delimiter=delimiter)
     return _parse_delimited_lines(lines, delimiter=delimiter)
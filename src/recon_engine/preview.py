@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import heapq
+import math
+from statistics import NormalDist
+from typing import Any
+
+from .config import EngineConfig
+from .ingestion import Ingestor, file_label, is_multi_file_path
+from .matching import cluster_records, detect_field_mismatches, sorted_tokens
+from .normalization import build_alias_lookup, map_record, normalize_batch
+from .utils import clean_string, stable_fingerprint
+
+PREVIEW_SAMPLE_SIZE = 1000
+
+
+def sampling_key(canon: dict[str, Any]) -> str:
+    tokens = sorted_tokens(clean_string(canon.get("name", "")))
+    if tokens:
+        local = clean_string(canon.get("email", "")).casefold().split("@", 1)[0]
+        return f"name:{tokens}|{local}"
+    for field in ("email", "phone", "customer_id"):
+        value = clean_string(canon.get(field, "")).casefold()
+        if value:
+            return f"{field}:{value}"
+    return f"row:{canon['source_name']}:{canon['source_row']}"
+
+
+def key_priority(key: str) -> float:
+    return int.from_bytes(stable_fingerprint(key), "big") / 2.0**64
+
+
+class KeyReservoir:
+    # Bottom-k reservoir over key priorities: whole keys are kept or evicted together, so
+    # records sharing a sampling key (likely duplicates) land in the sample together.
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.threshold = 1.0
+        self.seen = 0
+        self._buckets: dict[float, list[Any]] = {}
+        self._heap: list[float] = []
+        self._count = 0
+
+    def offer(self, priority: float, item: Any) -> None:
+        self.seen += 1
+        if priority >= self.threshold:
+            return
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = []
+            heapq.heappush(self._heap, -priority)
+        bucket.append(item)
+        self._count += 1
+        while self._count > self.size:
+            evicted = -heapq.heappop(self._heap)
+            self._count -= len(self._buckets.pop(evicted))
+            self.threshold = evicted
+
+    def items_below(self, threshold: float) -> list[Any]:
+        return [item for priority, bucket in self._buckets.items() if priority < threshold for item in bucket]
+
+
+def wilson_interval(successes: float, trials: float, confidence: float = 0.95) -> tuple[float, float]:
+    if trials <= 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    p = successes / trials
+    denom = 1.0 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def _rate(successes: int, trials: int, clusters: int, confidence: float) -> dict[str, float]:
+    rate = successes / trials if trials else 0.0
+    # Records are sampled in key clusters, so the interval uses the number of sampled keys
+    # as the effective sample size.
+    low, high = wilson_interval(rate * clusters, clusters, confidence)
+    return {"rate": round(rate, 4), "ci_low": round(low, 4), "ci_high": round(high, 4)}
+
+
+def _cluster(config: EngineConfig, records: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    return cluster_records(
+        records, threshold=config.similarity_threshold, limits=config.match_limits, rules=config.match_rules
+    )
+
+
+def run_preview(
+    config: EngineConfig,
+    sample_size: int = PREVIEW_SAMPLE_SIZE,
+    confidence: float = 0.95,
+    ingestor: Ingestor | None = None,
+) -> dict[str, Any]:
+    ingestor = ingestor or Ingestor(max_workers=config.ingest_workers)
+    reservoirs: dict[str, KeyReservoir] = {}
+    for src in config.sources:
+        sharded = is_multi_file_path(src.path)
+        alias_lookup = build_alias_lookup(config.field_aliases, src.field_map)
+        reservoir = reservoirs[src.name] = KeyReservoir(sample_size)
+        for path, i, row in ingestor.stream_source(src):
+            canon = map_record(row, src.name, f"{file_label(src.path, path)}:{i}" if sharded else i, alias_lookup)
+            key = sampling_key(canon)
+            reservoir.offer(key_priority(key), (key, canon))
+
+    samples = {name: reservoir.items_below(reservoir.threshold) for name, reservoir in reservoirs.items()}
+    normalize_batch([canon for sample in samples.values() for _, canon in sample])
+
+    # Per-source rates come from each source's own sample, clustered on its own.
+    sources: dict[str, dict[str, Any]] = {}
+    for name, sample in samples.items():
+        own = [canon for _, canon in sample]
+        own_groups = _cluster(config, own)
+        sources[name] = {
+            "sampled": len(own),
+            "total": reservoirs[name].seen,
+            "key_fraction": round(reservoirs[name].threshold, 6),
+            "duplicate_rate": _rate(
+                sum(len(recs) for recs in own_groups.values() if len(recs) > 1),
+                len(own),
+                len({key for key, _ in sample}),
+                confidence,
+            ),
+        }
+
+    # The combined estimate uses one key-space fraction for every source so cross-source
+    # duplicates stay in the sample together.
+    fraction = min((r.threshold for r in reservoirs.values()), default=1.0)
+    records: list[dict[str, Any]] = []
+    keys: dict[int, str] = {}
+    for reservoir in reservoirs.values():
+        for key, canon in reservoir.items_below(fraction):
+            keys[id(canon)] = key
+            records.append(canon)
+    groups = _cluster(config, records)
+    duplicate_groups = [recs for recs in groups.values() if len(recs) > 1]
+    mismatch_groups = sum(
+        1
+        for recs in duplicate_groups
+        if detect_field_mismatches(recs, config.critical_columns, config.numeric_tolerance)
+    )
+    in_duplicates = {id(rec) for recs in duplicate_groups for rec in recs}
+
+    total_records = sum(info["total"] for info in sources.values())
+    return {
+        "preview": True,
+        "confidence": confidence,
+        "key_fraction": round(fraction, 6),
+        "sample_records": len(records),
+        "total_records": total_records,
+        "sources": sources,
+        "entity_groups": len(groups),
+        "duplicate_groups": len(duplicate_groups),
+        "duplicate_rate": _rate(len(in_duplicates), len(records), len(set(keys.values())), confidence),
+        "mismatch_rate": _rate(mismatch_groups, len(duplicate_groups), len(duplicate_groups), confidence),
+        "projected": {
+            "duplicate_records": round(len(in_duplicates) / len(records) * total_records) if records else 0,
+            "duplicate_groups": round(len(duplicate_groups) / fraction) if fraction else 0,
+            "mismatch_groups": round(mismatch_groups / fraction) if fraction else 0,
+        },
+    }
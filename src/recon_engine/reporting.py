@@ -3,23 +3,150 @@ from __future__ import annotations
 import csv
 import json
 import os
-from typing import Any
+import pickle
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator
+
+
+WRITER_QUEUE_SIZE = 64
 
 
 def write_csv(path: str, rows: list[dict[str, Any]], field_order: list[str] | None = None) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
     if not rows:
-        with open(path, "w", encoding="utf-8", newline="") as f:
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
             f.write("")
+        os.replace(tmp_path, path)
         return
     fields = field_order or sorted({k for row in rows for k in row.keys()})
-    with open(path, "w", encoding="utf-8", newline="") as f:
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
         writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
         writer.writeheader()
         writer.writerows(rows)
+    os.replace(tmp_path, path)
 
 
 def write_json(path: str, payload: dict[str, Any]) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(payload, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class ArtifactWriter(ABC):
+    def __init__(
+        self, path: str, field_order: list[str] | None = None, queue_size: int = WRITER_QUEUE_SIZE
+    ) -> None:
+        self.path = path
+        self.field_order = field_order
+        self.tmp_path = path + ".tmp"
+        self._queue: queue.Queue[list[dict[str, Any]] | None] = queue.Queue(maxsize=queue_size)
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"writer:{os.path.basename(path)}", daemon=True
+        )
+        self._thread.start()
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        if self._error is not None:
+            raise self._error
+        batch = list(rows)
+        if batch:
+            self._queue.put(batch)
+
+    def close(self, commit: bool = True) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None or not commit:
+            for leftover in (self.tmp_path, self.tmp_path + ".rows"):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+            if self._error is not None and commit:
+                raise self._error
+            return
+        os.replace(self.tmp_path, self.path)
+
+    @abstractmethod
+    def _emit(self, header: list[str], rows: Iterator[list[Any]]) -> None: ...
+
+    def _run(self) -> None:
+        try:
+            self._consume()
+        except BaseException as e:
+            self._error = e
+            while not self._closed and self._queue.get() is not None:
+                pass
+
+    def _batches(self) -> Iterator[list[dict[str, Any]]]:
+        while (batch := self._queue.get()) is not None:
+            yield batch
+        self._closed = True
+
+    def _consume(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if self.field_order is not None:
+            fields = self.field_order
+            self._emit(fields, ([row.get(f, "") for f in fields] for batch in self._batches() for row in batch))
+            return
+
+        # Columns are not known up front, so rows are spooled in first-seen column order and
+        # re-laid under the sorted header once the stream ends.
+        spool_path = self.tmp_path + ".rows"
+        fields = []
+        positions: dict[str, int] = {}
+        with open(spool_path, "wb") as f:
+            for batch in self._batches():
+                values = []
+                for row in batch:
+                    for key in row:
+                        if key not in positions:
+                            positions[key] = len(fields)
+                            fields.append(key)
+                    values.append([row.get(field, "") for field in fields])
+                pickle.dump(values, f, protocol=pickle.HIGHEST_PROTOCOL)
+        header = sorted(fields)
+        order = [positions[field] for field in header]
+        width = len(fields)
+
+        def relaid(src: Any) -> Iterator[list[Any]]:
+            while True:
+                try:
+                    batch = pickle.load(src)
+                except EOFError:
+                    return
+                for values in batch:
+                    if len(values) < width:
+                        values += [""] * (width - len(values))
+                    yield [values[i] for i in order]
+
+        with open(spool_path, "rb") as src:
+            self._emit(header, relaid(src))
+        os.remove(spool_path)
+
+
+class CsvArtifactWriter(ArtifactWriter):
+    def _emit(self, header: list[str], rows: Iterator[list[Any]]) -> None:
+        with open(self.tmp_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            for values in rows:
+                if header:
+                    writer.writerow(header)
+                    header = []
+                writer.writerow(values)
+
+
+class XlsxArtifactWriter(ArtifactWriter):
+    def _emit(self, header: list[str], rows: Iterator[list[Any]]) -> None:
+        from .xlsx_io import XlsxStreamWriter
+
+        with XlsxStreamWriter(self.tmp_path, header) as writer:
+            for values in rows:
+                writer.write_row(values)
+
+
+ARTIFACT_WRITERS = {"csv": CsvArtifactWriter, "xlsx": XlsxArtifactWriter}
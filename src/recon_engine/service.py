@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import unquote
+
+from .config import EngineConfig, SourceConfig
+from .engine import ReconciliationEngine
+from .matching import IncrementalClusterer, detect_field_mismatches
+from .normalization import build_alias_lookup, normalize_record
+
+
+class ReconciliationService:
+    def __init__(self, config: EngineConfig) -> None:
+        self.config = config
+        self.engine = ReconciliationEngine(config)
+        self.lock = threading.Lock()
+        self.field_maps = {src.name: src.field_map for src in config.sources}
+
+        normalized, self.source_counts = self.engine.load_records()
+        groups, report, _ = self.engine.cluster(normalized)
+        self.clusterer = IncrementalClusterer.from_groups(
+            groups, config.similarity_threshold, config.match_rules, hot_keys=report.hot_keys
+        )
+        self.clusterer.rule_fires.update(report.rule_fires)
+        self.total_records = len(normalized)
+        self._sizes: dict[str, int] = {}
+        self._mismatched: set[str] = set()
+        self.duplicate_groups = 0
+        self.duplicate_records = 0
+        for key in self.clusterer.groups:
+            self._track(key)
+
+    def summary(self) -> dict[str, Any]:
+        with self.lock:
+            return self._summary()
+
+    def submit_records(self, source_name: str, rows: list[dict[str, Any]]) -> dict[str, Any]:
+        with self.lock:
+            alias_lookup = build_alias_lookup(self.config.field_aliases, self.field_maps.get(source_name))
+            start = _source_total(self.source_counts.get(source_name, 0))
+            records = [
+                normalize_record(row, source_name=source_name, row_num=start + i, alias_lookup=alias_lookup)
+                for i, row in enumerate(rows, start=1)
+            ]
+            _add_count(self.source_counts, source_name, len(records))
+            return self._ingest(records)
+
+    def submit_source(self, source: SourceConfig) -> dict[str, Any]:
+        records, counts = self.engine.load_records([source])
+        with self.lock:
+            self.field_maps.setdefault(source.name, source.field_map)
+            _add_count(self.source_counts, source.name, _source_total(counts[source.name]))
+            return self._ingest(records)
+
+    def group(self, group_key: str) -> dict[str, Any] | None:
+        with self.lock:
+            if group_key not in self.clusterer.groups:
+                return None
+            members = list(self.clusterer.members(group_key))
+            mismatch = detect_field_mismatches(
+                members, self.config.critical_columns, self.config.numeric_tolerance
+            )
+            return {"group_key": group_key, "records": members, "mismatches": mismatch}
+
+    def _ingest(self, records: list[dict[str, Any]]) -> dict[str, Any]:
+        touched: dict[str, None] = {}
+        assigned = []
+        for rec in records:
+            key = self.clusterer.add(rec)
+            touched[key] = None
+            assigned.append({"source_name": rec["source_name"], "source_row": rec["source_row"], "group_key": key})
+        self.total_records += len(records)
+        for key in touched:
+            self._track(key)
+        return {"assigned": assigned, "summary": self._summary()}
+
+    def _track(self, key: str) -> None:
+        members = self.clusterer.members(key)
+        previous = self._sizes.get(key, 0)
+        if previous > 1:
+            self.duplicate_groups -= 1
+            self.duplicate_records -= previous
+        self._sizes[key] = len(members)
+        if len(members) > 1:
+            self.duplicate_groups += 1
+            self.duplicate_records += len(members)
+        if detect_field_mismatches(members, self.config.critical_columns, self.config.numeric_tolerance):
+            self._mismatched.add(key)
+        else:
+            self._mismatched.discard(key)
+
+    def _summary(self) -> dict[str, Any]:
+        return {
+            "total_records_ingested": self.total_records,
+            "source_counts": copy.deepcopy(self.source_counts),
+            "entity_groups": len(self.clusterer.groups),
+            "duplicate_groups": self.duplicate_groups,
+            "duplicate_records": self.duplicate_records,
+            "mismatch_groups": len(self._mismatched),
+            "output_records": len(self.clusterer.groups),
+            "rule_fires": dict(self.clusterer.rule_fires),
+        }
+
+
+def _source_total(count: Any) -> int:
+    return count["total"] if isinstance(count, dict) else int(count)
+
+
+def _add_count(source_counts: dict[str, Any], name: str, added: int) -> None:
+    current = source_counts.get(name, 0)
+    if isinstance(current, dict):
+        current["total"] += added
+    else:
+        source_counts[name] = current + added
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service: ReconciliationService
+
+    def do_GET(self) -> None:
+        start = time.perf_counter()
+        if self.path == "/health":
+            self._reply(200, {"status": "ok"}, start)
+        elif self.path == "/summary":
+            self._reply(200, {"summary": self.service.summary()}, start)
+        elif self.path.startswith("/groups/"):
+            group = self.service.group(unquote(self.path[len("/groups/") :]))
+            if group is None:
+                self._reply(404, {"error": "Unknown group"}, start)
+            else:
+                self._reply(200, group, start)
+        else:
+            self._reply(404, {"error": f"Unknown path: {self.path}"}, start)
+
+    def do_POST(self) -> None:
+        start = time.perf_counter()
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body, dict):
+                raise ValueError("Body must be a JSON object")
+            if self.path == "/records":
+                rows = body.get("records")
+                if "record" in body:
+                    rows = [body["record"]]
+                if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+                    raise ValueError("Body must contain 'record' or a 'records' list of objects")
+                result = self.service.submit_records(str(body.get("source", "submitted")), rows)
+            elif self.path == "/sources":
+                result = self.service.submit_source(SourceConfig(**body))
+            else:
+                self._reply(404, {"error": f"Unknown path: {self.path}"}, start)
+                return
+        except (ValueError, TypeError, KeyError, OSError) as e:
+            self._reply(400, {"error": str(e)}, start)
+            return
+        self._reply(200, result, start)
+
+    def _reply(self, status: int, payload: dict[str, Any], start: float) -> None:
+        payload["elapsed_ms"] = round((time.perf_counter() - start) * 1000.0, 3)
+        data = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(
+    service: ReconciliationService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | None = None,
+) -> socketserver.BaseServer:
+    handler = type("ServiceHandler", (_Handler,), {"service": service})
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        return _UnixHTTPServer(socket_path, handler)
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(
+    config: EngineConfig,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: str | None = None,
+) -> None:
+    service = ReconciliationService(config)
+    server = make_server(service, host=host, port=port, socket_path=socket_path)
+    where = socket_path or f"http://{host}:{server.server_address[1]}"
+    print(json.dumps({"listening": where, "summary": service.summary()}, indent=2), flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
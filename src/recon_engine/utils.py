@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
+import importlib
 import re
+from functools import lru_cache
 from typing import Any
 
 
@@ -27,6 +30,19 @@ OCR_CHAR_MAP = str.maketrans(
 )
 
 
+@lru_cache(maxsize=None)
+def optional_import(module: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except Exception:
+        return None
+
+
+def stable_fingerprint(*parts: str, digest_size: int = 8) -> bytes:
+    payload = "\x1f".join(parts).encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(payload, digest_size=digest_size).digest()
+
+
 def clean_string(value: Any) -> str:
     if value is None:
         return ""
@@ -48,6 +64,8 @@ def normalize_phone(value: Any) -> str:
 
 
 def parse_date(value: Any) -> str:
+    if isinstance(value, dt.date):
+        return (value.date() if isinstance(value, dt.datetime) else value).isoformat()
     raw = clean_string(value)
     if not raw:
         return ""
@@ -104,3 +122,93 @@ def detect_currency(value: Any, default: str = "USD") -> str:
     if "JPY" in upper or "¥" in raw:
         return "JPY"
     return "USD" if ("$" in raw or "USD" in upper) else default
+
+
+_BATCH_SEP = "\x00"
+_CURRENCY_CODES = re.compile(r"(?i)(usd|eur|gbp|cad|aud|inr|jpy)")
+_WHITESPACE = re.compile(r"\s+")
+_NON_NUMERIC = re.compile(r"[^0-9.\-\x00]")
+_NON_DIGIT = re.compile(r"[^\d\x00]+")
+_FLOAT_TEXT = re.compile(r"-?(?:\d+\.?\d*|\.\d+)")
+_CURRENCY_RULES = [
+    ("EUR", "EUR", "€"),
+    ("GBP", "GBP", "£"),
+    ("CAD", "CAD", None),
+    ("AUD", "AUD", None),
+    ("INR", "INR", "₹"),
+    ("JPY", "JPY", "¥"),
+    ("USD", "USD", "$"),
+]
+
+
+def _batch_texts(values: list[Any]) -> list[str] | None:
+    texts = ["" if v is None else str(v) for v in values]
+    joined = _BATCH_SEP.join(texts)
+    if joined.count(_BATCH_SEP) != max(len(texts) - 1, 0):
+        return None
+    return texts
+
+
+def _split_comma(raw: str) -> str:
+    if "." in raw:
+        return raw.replace(",", "")
+    if raw.count(",") == 1:
+        left, right = raw.split(",")
+        return f"{left}.{right}" if len(right) in (1, 2) else left + right
+    return raw.replace(",", "")
+
+
+def to_float_batch(values: list[Any]) -> list[float | None]:
+    texts = _batch_texts(values)
+    if texts is None:
+        return [to_float(v) for v in values]
+    joined = _WHITESPACE.sub("", _BATCH_SEP.join(texts))
+    joined = _CURRENCY_CODES.sub("", joined)
+    joined = joined.replace("$", "").replace("€", "").replace("£", "").translate(OCR_CHAR_MAP)
+    parts = [_split_comma(p) if "," in p else p for p in joined.split(_BATCH_SEP)]
+    parts = _NON_NUMERIC.sub("", _BATCH_SEP.join(parts)).split(_BATCH_SEP)
+
+    out: list[float | None] = [None] * len(parts)
+    valid = [
+        i for i, (text, part) in enumerate(zip(texts, parts)) if text.strip() and _FLOAT_TEXT.fullmatch(part)
+    ]
+    if not valid:
+        return out
+    np = optional_import("numpy")
+    if np is None:
+        numbers = [float(parts[i]) for i in valid]
+    else:
+        numbers = np.array([parts[i] for i in valid]).astype(np.float64).tolist()
+    for i, number in zip(valid, numbers):
+        out[i] = number
+    return out
+
+
+def normalize_phone_batch(values: list[Any]) -> list[str]:
+    texts = _batch_texts(values)
+    if texts is None:
+        return [normalize_phone(v) for v in values]
+    joined = _BATCH_SEP.join(texts).translate(OCR_CHAR_MAP)
+    digits = _NON_DIGIT.sub("", joined).split(_BATCH_SEP)
+    return [d[1:] if len(d) == 11 and d.startswith("1") else d for d in digits]
+
+
+def detect_currency_batch(values: list[Any], default: str = "USD") -> list[str]:
+    np = optional_import("numpy")
+    texts = _batch_texts(values)
+    if np is None or texts is None or not texts:
+        return [detect_currency(v, default) for v in values]
+    raw = np.array(texts, dtype=str)
+    if _BATCH_SEP.join(texts).isascii():
+        upper = np.char.upper(raw)
+    else:
+        # str.upper can expand or remap non-ASCII characters; keep its exact semantics.
+        upper = np.array([t.upper() for t in texts], dtype=str)
+    conditions = []
+    for _, code, symbol in _CURRENCY_RULES:
+        hit = np.char.find(upper, code) >= 0
+        if symbol is not None:
+            hit |= np.char.find(raw, symbol) >= 0
+        conditions.append(hit)
+    labels = [label for label, _, _ in _CURRENCY_RULES]
+    return np.select(conditions, labels, default=default).tolist()
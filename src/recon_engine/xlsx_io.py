@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import io
+import re
 import zipfile
 import xml.etree.ElementTree as ET
 from typing import Any
@@ -17,67 +18,160 @@ def _col_letter(index: int) -> str:
     return letter
 
 
+_CONTROL_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+MAX_SHEET_ROWS = 1_048_576
+_MAX_EXACT_NUMBER = 1e15
+
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def _escape(text: str) -> str:
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return _CONTROL_CHARS.sub("", text)
+
+
+class XlsxStreamWriter:
+    def __init__(self, path: str, headers: list[str], max_sheet_rows: int = MAX_SHEET_ROWS) -> None:
+        self.headers = list(headers)
+        self.max_sheet_rows = max_sheet_rows
+        self._zf = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self._columns = [_col_letter(i) for i in range(len(self.headers))]
+        self._strings: dict[str, int] = {}
+        self._string_refs = 0
+        self._sheet: io.TextIOWrapper | None = None
+        self._sheet_count = 0
+        self._row = 0
+
+    def __enter__(self) -> "XlsxStreamWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def write_row(self, values: list[Any]) -> None:
+        if self._sheet is None or self._row >= self.max_sheet_rows:
+            self._open_sheet()
+        self._write_row(values)
+
+    def close(self) -> None:
+        if self._zf is None:
+            return
+        if self._sheet is None:
+            self._open_sheet()
+        self._close_sheet()
+        with io.TextIOWrapper(self._zf.open("xl/sharedStrings.xml", "w", force_zip64=True), encoding="utf-8") as f:
+            f.write(
+                f'{_XML_HEADER}<sst xmlns="{_MAIN_NS}" count="{self._string_refs}" '
+                f'uniqueCount="{len(self._strings)}">'
+            )
+            for text in self._strings:
+                f.write(f'<si><t xml:space="preserve">{_escape(text)}</t></si>')
+            f.write("</sst>")
+        self._strings = {}
+        self._write_package_parts()
+        self._zf.close()
+        self._zf = None
+
+    def _open_sheet(self) -> None:
+        self._close_sheet()
+        self._sheet_count += 1
+        self._sheet = io.TextIOWrapper(
+            self._zf.open(f"xl/worksheets/sheet{self._sheet_count}.xml", "w", force_zip64=True),
+            encoding="utf-8",
+        )
+        self._sheet.write(f'{_XML_HEADER}<worksheet xmlns="{_MAIN_NS}"><sheetData>')
+        self._row = 0
+        self._write_row(self.headers)
+
+    def _close_sheet(self) -> None:
+        if self._sheet is not None:
+            self._sheet.write("</sheetData></worksheet>")
+            self._sheet.close()
+            self._sheet = None
+
+    def _write_row(self, values: list[Any]) -> None:
+        self._row += 1
+        row = self._row
+        strings = self._strings
+        cells = []
+        refs = 0
+        for column, value in zip(self._columns, values):
+            kind = type(value)
+            if kind is not str:
+                if value is None:
+                    continue
+                if (kind is float or kind is int) and -_MAX_EXACT_NUMBER < value < _MAX_EXACT_NUMBER:
+                    cells.append(f'<c r="{column}{row}"><v>{value!r}</v></c>')
+                    continue
+                value = str(value)
+            elif not value:
+                continue
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            refs += 1
+            cells.append(f'<c r="{column}{row}" t="s"><v>{index}</v></c>')
+        self._string_refs += refs
+        self._sheet.write(f'<row r="{row}">{"".join(cells)}</row>')
+
+    def _write_package_parts(self) -> None:
+        sheet_ids = range(1, self._sheet_count + 1)
+        sheets = "".join(f'<sheet name="Sheet{i}" sheetId="{i}" r:id="rId{i}"/>' for i in sheet_ids)
+        sheet_rels = "".join(
+            f'<Relationship Id="rId{i}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+            for i in sheet_ids
+        )
+        sheet_types = "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in sheet_ids
+        )
+        self._zf.writestr(
+            "[Content_Types].xml",
+            f'{_XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/sharedStrings.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+            f"{sheet_types}</Types>",
+        )
+        self._zf.writestr(
+            "_rels/.rels",
+            f'{_XML_HEADER}<Relationships xmlns="{_PKG_REL_NS}">'
+            f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+            "</Relationships>",
+        )
+        self._zf.writestr(
+            "xl/workbook.xml",
+            f'{_XML_HEADER}<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheets>{sheets}</sheets></workbook>',
+        )
+        self._zf.writestr(
+            "xl/_rels/workbook.xml.rels",
+            f'{_XML_HEADER}<Relationships xmlns="{_PKG_REL_NS}">{sheet_rels}'
+            f'<Relationship Id="rId{self._sheet_count + 1}" Type="{_REL_NS}/sharedStrings" '
+            'Target="sharedStrings.xml"/></Relationships>',
+        )
+
+
 def write_simple_xlsx(path: str, rows: list[dict[str, Any]]) -> None:
     headers = list(rows[0].keys()) if rows else []
-    sheet_rows = [headers] + [[row.get(h, "") for h in headers] for row in rows]
-
-    def build_sheet_xml() -> str:
-        lines = [
-            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>',
-            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">',
-            "<sheetData>",
-        ]
-        for r_idx, row in enumerate(sheet_rows, start=1):
-            lines.append(f'<row r="{r_idx}">')
-            for c_idx, value in enumerate(row):
-                ref = f"{_col_letter(c_idx)}{r_idx}"
-                text = str(value if value is not None else "")
-                text = (
-                    text.replace("&", "&amp;")
-                    .replace("<", "&lt;")
-                    .replace(">", "&gt;")
-                )
-                lines.append(f'<c r="{ref}" t="inlineStr"><is><t>{text}</t></is></c>')
-            lines.append("</row>")
-        lines += ["</sheetData>", "</worksheet>"]
-        return "".join(lines)
-
-    workbook_xml = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
-        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'
-    )
-    content_types = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
-        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
-        '<Default Extension="xml" ContentType="application/xml"/>'
-        '<Override PartName="/xl/workbook.xml" '
-        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
-        '<Override PartName="/xl/worksheets/sheet1.xml" '
-        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
-        "</Types>"
-    )
-    rels_root = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
-        'Target="xl/workbook.xml"/></Relationships>'
-    )
-    rels_wb = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
-        'Target="worksheets/sheet1.xml"/></Relationships>'
-    )
-
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("[Content_Types].xml", content_types)
-        zf.writestr("_rels/.rels", rels_root)
-        zf.writestr("xl/workbook.xml", workbook_xml)
-        zf.writestr("xl/_rels/workbook.xml.rels", rels_wb)
-        zf.writestr("xl/worksheets/sheet1.xml", build_sheet_xml())
+    with XlsxStreamWriter(path, headers) as writer:
+        for row in rows:
+            writer.write_row([row.get(h, "") for h in headers])
+
+
+def _col_index(ref: str) -> int:
+    index = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        index = index * 26 + ord(ch.upper()) - 64
+    return index - 1
 
 
 def read_simple_xlsx(path: str) -> list[dict[str, str]]:
@@ -96,6 +190,9 @@ def read_simple_xlsx(path: str) -> list[dict[str, str]]:
     for row in root.findall(".//m:row", NS):
         vals: list[str] = []
         for cell in row.findall("m:c", NS):
+            ref = cell.attrib.get("r")
+            if ref:
+                vals += [""] * (_col_index(ref) - len(vals))
             cell_type = cell.attrib.get("t", "")
             if cell_type == "inlineStr":
                 t_node = cell.find("m:is/m:t", NS)
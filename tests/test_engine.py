@@ -4,6 +4,8 @@ import csv
 import json
 import subprocess
 import sys
+import tempfile
+import zipfile
 from pathlib import Path
 
 
@@ -12,10 +14,656 @@ def read_csv(path: Path) -> list[dict[str, str]]:
         return list(csv.DictReader(f))
 
 
+def check_mismatch_comparators() -> None:
+    from src.recon_engine.matching import detect_field_mismatches
+
+    recs = [
+        {"amount": "1200.5", "name": "BOB LEE", "dob": "01/12/1990"},
+        {"amount": "1200.50", "name": "bob lee", "dob": "1990-01-12"},
+    ]
+    assert detect_field_mismatches(recs, ["amount", "name", "dob"]) == {}
+    recs.append({"amount": 1210.0, "name": "Rob Lee"})
+    found = detect_field_mismatches(recs, ["amount", "name", "dob"])
+    assert sorted(found) == ["amount", "name"], found
+    assert found["amount"] == ["1200.5", 1210.0], found
+
+
+def check_sharded_source() -> None:
+    from src.recon_engine.config import EngineConfig, SourceConfig
+    from src.recon_engine.engine import ReconciliationEngine
+
+    with tempfile.TemporaryDirectory() as tmp:
+        shards = Path(tmp) / "shards"
+        shards.mkdir()
+        (shards / "day1.csv").write_text("id,name,email\nC1,Ann Lee,ann@x.com\n", encoding="utf-8")
+        (shards / "day2.csv").write_text(
+            "id,name,email\nC1,Ann Lee,ann@x.com\nC2,Ben Ng,ben@x.com\n", encoding="utf-8"
+        )
+        config = EngineConfig(
+            sources=[SourceConfig(name="crm", type="csv", path=str(shards))],
+            source_priority=["crm"],
+            id_columns=["customer_id"],
+            critical_columns=["name"],
+            output_dir=str(Path(tmp) / "out"),
+            similarity_threshold=0.9,
+        )
+        summary = ReconciliationEngine(config).run()["summary"]
+        assert summary["source_counts"]["crm"] == {"total": 3, "files": {"day1.csv": 1, "day2.csv": 2}}
+        assert summary["exact_duplicates_collapsed"] == 1 and summary["duplicate_records"] == 2, summary
+        normalized = read_csv(Path(tmp) / "out" / "normalized_records.csv")
+        assert [r["source_row"] for r in normalized] == ["day1.csv:1", "day2.csv:1", "day2.csv:2"]
+
+
+def check_delta_output() -> None:
+    from src.recon_engine.config import EngineConfig, SourceConfig
+    from src.recon_engine.engine import ReconciliationEngine
+    from src.recon_engine.service import ReconciliationService
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "crm.csv"
+        config = EngineConfig(
+            sources=[SourceConfig(name="crm", type="csv", path=str(src))],
+            source_priority=["crm"],
+            id_columns=["customer_id"],
+            critical_columns=["name"],
+            output_dir=str(Path(tmp) / "out"),
+            similarity_threshold=0.9,
+        )
+        src.write_text("id,name\nC1,Ann Lee\nC2,Ben Ng\nC3,Cy Oh\n", encoding="utf-8")
+        first = ReconciliationEngine(config).run()["summary"]["delta"]
+        assert first == {"inserted": 3, "updated": 0, "deleted": 0, "mismatch_changes": 0}, first
+        src.write_text("id,name\nC1,Ann Lee\nC2,Ben Ng Jr\nC4,Di Wu\n", encoding="utf-8")
+        config.output_mode = "delta"
+        second = ReconciliationEngine(config).run()["summary"]["delta"]
+        assert second == {"inserted": 1, "updated": 1, "deleted": 1, "mismatch_changes": 0}, second
+        changes = read_csv(Path(tmp) / "out" / "unified_delta.csv")
+        assert sorted(r["change_type"] for r in changes) == ["delete", "insert", "update"], changes
+        src.write_text("id,name\nC0,Al Ma\nC1,Ann Lee\nC2,Ben Ng Jr\nC4,Di Wu\n", encoding="utf-8")
+        summary = ReconciliationEngine(config).run()["summary"]
+        assert summary["delta"] == {"inserted": 1, "updated": 0, "deleted": 0, "mismatch_changes": 0}, summary
+        assert summary["stale_artifacts"] == ["mismatch_report.csv", "unified_dataset.csv"], summary
+
+
+def check_checkpoint_resume() -> None:
+    from dataclasses import replace
+
+    from src.recon_engine.checkpoint import run_fingerprint
+    from src.recon_engine.config import EngineConfig, SourceConfig
+    from src.recon_engine.engine import ReconciliationEngine
+    from src.recon_engine.service import ReconciliationService
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "crm.csv"
+        src.write_text("id,name\nC1,Ann Lee\nC2,Ann Lee\nC3,Cy Oh\n", encoding="utf-8")
+        config = EngineConfig(
+            sources=[SourceConfig(name="crm", type="csv", path=str(src))],
+            source_priority=["crm"],
+            id_columns=["customer_id"],
+            critical_columns=["name"],
+            output_dir=str(Path(tmp) / "out"),
+            similarity_threshold=0.9,
+            checkpoints=True,
+        )
+        first = ReconciliationEngine(config).run()["summary"]
+        assert "resumed_stages" not in first
+        resumed = ReconciliationEngine(config).run(resume=True)["summary"]
+        assert resumed.pop("resumed_stages") == ["ingest", "cluster", "post"]
+        first.pop("delta"), resumed.pop("delta")
+        assert resumed == first, (first, resumed)
+        config.output_formats = ["csv", "xlsx"]
+        reformatted = ReconciliationEngine(config).run(resume=True)["summary"]
+        assert reformatted["resumed_stages"] == ["ingest", "cluster", "post"], reformatted
+        assert (Path(tmp) / "out" / "unified_dataset.xlsx").exists()
+        config.output_formats = ["csv"]
+        remote = replace(config, sources=[SourceConfig(name="api", type="api", path="https://example.test/c")])
+        assert run_fingerprint(remote) != run_fingerprint(remote)
+        src.write_text("id,name\nC1,Ann Lee\nC3,Cy Oh\nC4,Di Wu\nC5,Ed Yu\n", encoding="utf-8")
+        changed = ReconciliationEngine(config).run(resume=True)["summary"]
+        assert "resumed_stages" not in changed and changed["total_records_ingested"] == 4, changed
+
+
+def check_sql_source() -> None:
+    import sqlite3
+    import types
+    from typing import Any
+
+    from src.recon_engine import ingestion
+    from src.recon_engine.config import EngineConfig, SourceConfig
+    from src.recon_engine.engine import ReconciliationEngine
+    from src.recon_engine.ingestion import Ingestor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "crm.db"
+        with sqlite3.connect(db) as conn:
+            conn.execute("CREATE TABLE customers (cust_id TEXT, full_name TEXT, total REAL, updated_at TEXT)")
+            conn.executemany(
+                "INSERT INTO customers VALUES (?, ?, ?, ?)",
+                [
+                    ("C1", "Ann Lee", 10.5, "2026-01-01"),
+                    ("C2", "Bo Chan", 20.0, "2026-02-01"),
+                    ("C3", "Cy Oh", None, "2026-03-01"),
+                ],
+            )
+        conn.close()
+        source = SourceConfig(
+            name="crm",
+            type="sql",
+            path=f"sqlite:///{db}",
+            field_map={"cust_id": "customer_id", "full_name": "name", "total": "amount"},
+            query="SELECT * FROM customers ORDER BY cust_id",
+            batch_size=2,
+        )
+        config = EngineConfig(
+            sources=[source],
+            source_priority=["crm"],
+            id_columns=["customer_id"],
+            critical_columns=["name"],
+            output_dir=str(Path(tmp) / "out"),
+            similarity_threshold=0.9,
+        )
+        engine = ReconciliationEngine(config)
+        records, counts = engine.load_records()
+        assert counts == {"crm": 3}, counts
+        assert [r["customer_id"] for r in records] == ["C1", "C2", "C3"]
+        assert records[0]["name"] == "Ann Lee" and records[0]["amount"] == 10.5, records[0]
+        source.since = "2026-01-15"
+        records, counts = engine.load_records()
+        assert [r["customer_id"] for r in records] == ["C2", "C3"], records
+
+    class ServerSideCursor:
+        # Like a psycopg2 named cursor: description stays None until the first fetch.
+        arraysize = 1
+        description = None
+
+        def __init__(self, name: str) -> None:
+            self.rows = [("C9", "Dee Fox"), ("C8", "Eli Ray")]
+
+        def execute(self, sql: str, params: Any) -> None:
+            pass
+
+        def fetchmany(self, size: int) -> list[tuple[str, str]]:
+            self.description = (("cust_id",), ("full_name",))
+            batch, self.rows = self.rows[:size], self.rows[size:]
+            return batch
+
+        def close(self) -> None:
+            pass
+
+    class ServerSideConnection:
+        def cursor(self, name: str = "") -> ServerSideCursor:
+            return ServerSideCursor(name)
+
+        def close(self) -> None:
+            pass
+
+    driver = types.SimpleNamespace(__name__="psycopg2", paramstyle="pyformat")
+    connect_sql = ingestion.connect_sql
+    ingestion.connect_sql = lambda dsn: (ServerSideConnection(), driver)
+    try:
+        table = Ingestor()._read_sql(SourceConfig(name="pg", type="sql", path="postgresql://db/crm", query="SELECT 1"))
+        assert table.as_dicts() == [
+            {"cust_id": "C9", "full_name": "Dee Fox"},
+            {"cust_id": "C8", "full_name": "Eli Ray"},
+        ], table.header
+    finally:
+        ingestion.connect_sql = connect_sql
+
+
+def check_artifact_writer() -> None:
+    import threading
+    from typing import Any, Iterator
+
+    from src.recon_engine.reporting import ArtifactWriter, CsvArtifactWriter, XlsxArtifactWriter, write_csv
+    from src.recon_engine.xlsx_io import read_simple_xlsx
+
+    rows = [{"b": 1, "a": "x"}, {"a": "y,\nz", "c": None}, {"c": 2.5}]
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            ArtifactWriter(str(Path(tmp) / "base.csv"))  # type: ignore[abstract]
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("ArtifactWriter without _emit was instantiated")
+        write_csv(str(Path(tmp) / "expected.csv"), rows)
+        writer = CsvArtifactWriter(str(Path(tmp) / "streamed.csv"), queue_size=1)
+        for row in rows:
+            writer.write_rows([row])
+        assert not (Path(tmp) / "streamed.csv").exists()
+        writer.close()
+        assert (Path(tmp) / "streamed.csv").read_bytes() == (Path(tmp) / "expected.csv").read_bytes()
+        assert sorted(p.name for p in Path(tmp).iterdir()) == ["expected.csv", "streamed.csv"]
+
+        class FailingWriter(CsvArtifactWriter):
+            def _emit(self, header: list[str], rows: Iterator[list[Any]]) -> None:
+                for _ in rows:
+                    pass
+                raise OSError("disk full")
+
+        failing = FailingWriter(str(Path(tmp) / "failed.csv"), field_order=["a"])
+        failing.write_rows(rows)
+        outcome: list[BaseException] = []
+
+        def close_failing() -> None:
+            try:
+                failing.close()
+            except OSError as e:
+                outcome.append(e)
+
+        closer = threading.Thread(target=close_failing, daemon=True)
+        closer.start()
+        closer.join(timeout=5)
+        assert not closer.is_alive(), "close() hung after _emit failed"
+        assert len(outcome) == 1 and not (Path(tmp) / "failed.csv").exists()
+
+        xlsx = XlsxArtifactWriter(str(Path(tmp) / "streamed.xlsx"))
+        xlsx.write_rows(rows + [{"a": "x"}])
+        xlsx.close()
+        assert read_simple_xlsx(str(Path(tmp) / "streamed.xlsx")) == read_csv(Path(tmp) / "expected.csv") + [
+            {"a": "x", "b": "", "c": ""}
+        ]
+        with zipfile.ZipFile(Path(tmp) / "streamed.xlsx") as zf:
+            sheet = zf.read("xl/worksheets/sheet1.xml").decode("utf-8")
+            strings = zf.read("xl/sharedStrings.xml").decode("utf-8")
+        assert '<c r="B2"><v>1</v></c>' in sheet and strings.count("<t xml:space=\"preserve\">x</t>") == 1
+
+
+def check_batch_normalization() -> None:
+    from src.recon_engine.utils import (
+        detect_currency,
+        detect_currency_batch,
+        normalize_phone,
+        normalize_phone_batch,
+        to_float,
+        to_float_batch,
+    )
+
+    values = ["$1,200.50 USD", "1.234,5", "12,3456", "EUR 9O.5", "", None, "  ", "-.5", "1-2", 7, "(555) 123-4567"]
+    assert to_float_batch(values) == [to_float(v) for v in values]
+    assert normalize_phone_batch(values) == [normalize_phone(v) for v in values]
+    assert detect_currency_batch(values) == [detect_currency(v) for v in values]
+
+
+def check_hot_keys() -> None:
+    from src.recon_engine.matching import ClusterReport, MatchLimits, cluster_records
+
+    records = [
+        {"name": f"Person {chr(65 + i)}{chr(65 + i // 3)} Smith", "phone": "0000000000", "dob": ""}
+        for i in range(20)
+    ]
+    records += [{"name": "Ann Lee", "phone": "5551234567"}, {"name": "Ann Lee", "phone": "5551234567"}]
+    report = ClusterReport()
+    groups = cluster_records(records, 0.9, MatchLimits(strategy="blocked", max_key_size=5), report)
+    assert report.hot_keys == {"phone:0000000000": 20}, report
+    assert max(len(v) for v in groups.values()) == 2, [len(v) for v in groups.values()]
+    assert len(cluster_records(records, 0.9, MatchLimits(max_key_size=0))) == 2
+
+
+def check_exact_duplicate_collapse() -> None:
+    from src.recon_engine.config import EngineConfig
+    from src.recon_engine.engine import ReconciliationEngine
+    from src.recon_engine.service import ReconciliationService
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "crm.csv"
+        rows = ["Info Desk,0000000000"] * 10 + ["Ann Lee,0000000000", "Bo Chan,0000000000", "Cy Oh,0000000000"]
+        src.write_text("name,phone\n" + "\n".join(rows) + "\n", encoding="utf-8")
+        cfg_path = Path(tmp) / "config.json"
+        cfg_path.write_text(
+            json.dumps(
+                {
+                    "sources": [{"name": "crm", "type": "csv", "path": str(src)}],
+                    "source_priority": ["crm"],
+                    "id_columns": ["customer_id"],
+                    "critical_columns": ["name"],
+                    "output_dir": str(Path(tmp) / "out"),
+                    "collapse_exact_duplicates": "yes",
+                    "checkpoints": "false",
+                    "match_limits": {"max_key_size": 5},
+                }
+            ),
+            encoding="utf-8",
+        )
+        config = EngineConfig.load(str(cfg_path))
+        assert config.collapse_exact_duplicates is True and config.checkpoints is False, config
+        summary = ReconciliationEngine(config).run()["summary"]
+        service = ReconciliationService(config)
+        assert service.clusterer.hot_keys == {"phone:0000000000"}
+        served = service.summary()
+        assert served["entity_groups"] == 4 and served["duplicate_records"] == 10, served
+        result = service.submit_records("crm", [{"name": "Dee Fox", "phone": "0000000000"}])
+        assert result["summary"]["entity_groups"] == 5, result
+    assert summary["exact_duplicates_collapsed"] == 9, summary
+    assert summary["clustering"]["hot_keys"] == {"phone:0000000000": 13}, summary["clustering"]
+    assert summary["entity_groups"] == 4 and summary["duplicate_records"] == 10, summary
+
+
+def check_match_limits_config() -> None:
+    from src.recon_engine.config import MatchLimits
+
+    limits = MatchLimits.from_dict({"strategy": "Blocked", "max_key_size": "50", "candidate_cap": 5.0})
+    assert limits == MatchLimits(strategy="blocked", max_key_size=50, candidate_cap=5), limits
+    for bad in ({"max_key_size": -1}, {"max_block_size": "many"}, {"strategy": "fast"}, {"max_keys": 5}, []):
+        try:
+            MatchLimits.from_dict(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted invalid match_limits {bad!r}")
+
+
+def check_csv_fast_path() -> None:
+    from src.recon_engine.normalization import build_alias_lookup, build_row_normalizer, normalize_record
+
+    header = ["ID", "Full_Name", "notes", "balance"]
+    values = ["C9", "ann  lee", "line one\nline two"]
+    lookup = build_alias_lookup({"amount": ["balance"]})
+    fast = build_row_normalizer(header, "crm", lookup)(values, 4)
+    slow = normalize_record(dict(zip(header, values + [None])), "crm", 4, alias_lookup=lookup)
+    assert fast == slow, (fast, slow)
+    assert fast["notes"] == "line one line two" and fast["amount"] == ""
+
+
+def check_pdf_fallback() -> None:
+    from src.recon_engine.pdf_io import _extract_text_runs_from_pdf_bytes, _parse_delimited_lines, write_simple_pdf_table
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "t.pdf")
+        write_simple_pdf_table(path, ["id", "name", "note"], [{"id": "1", "name": "Ann (A)", "note": "x"}])
+        rows = _parse_delimited_lines(_extract_text_runs_from_pdf_bytes(path), delimiter="|")
+    assert rows == [{"id": "1", "name": "Ann (A)", "note": "x"}], rows
+
+
+def check_lazy_imports(root: Path) -> None:
+    probe = "import sys, src.recon_engine.cli; print(','.join(m for m in ('requests', 'pdfplumber', 'rapidfuzz') if m in sys.modules))"
+    loaded = subprocess.check_output([sys.executable, "-c", probe], cwd=root, text=True).strip()
+    assert not loaded, f"Optional dependencies imported at startup: {loaded}"
+
+
+def check_stable_keys(root: Path) -> None:
+    import os
+
+    probe = (
+        "from src.recon_engine.matching import canonical_entity_key, record_fingerprint, stable_group_id; "
+        "rec = {'name': 'Ann Lee', 'address': '1 Main St', 'amount': 5.0}; "
+        "print(canonical_entity_key(rec), record_fingerprint(rec).hex(), stable_group_id([rec]))"
+    )
+    outputs = {
+        subprocess.check_output(
+            [sys.executable, "-c", probe], cwd=root, text=True, env={**os.environ, "PYTHONHASHSEED": seed}
+        )
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1, outputs
+    assert outputs.pop().startswith("fallback:")
+
+
+PLACE_PLAN_SOURCE = """\
+def first_match(a, b):
+    a_dob = a.dob
+    b_dob = b.dob
+    a_name_tokens = a.name_tokens
+    b_name_tokens = b.name_tokens
+    s_name_tokens = -1.0
+    c_name_tokens = 2.0
+    if a_dob and a_dob == b_dob:
+        if s_name_tokens < 0.0 or (s_name_tokens == 0.0 and c_name_tokens > 0.9):
+            s_name_tokens = ratio(a_name_tokens, b_name_tokens, score_cutoff=89.999999) / 100.0 \
+if a_name_tokens and b_name_tokens else 0.0
+            c_name_tokens = 0.9
+        if s_name_tokens >= 0.9:
+            return 'place:dob_name'
+    if s_name_tokens < 0.0 or (s_name_tokens == 0.0 and c_name_tokens > 0.9500000000000001):
+        s_name_tokens = ratio(a_name_tokens, b_name_tokens, score_cutoff=94.999999) / 100.0 \
+if a_name_tokens and b_name_tokens else 0.0
+        c_name_tokens = 0.9500000000000001
+    if s_name_tokens >= 0.9500000000000001:
+        return 'place:strong_name'
+    return None
+"""
+
+
+def check_match_rules() -> None:
+    from src.recon_engine import matching
+    from src.recon_engine.config import MatchRules
+    from src.recon_engine.matching import ClusterReport, MatchPlan, _plan_source, cluster_records
+    from src.recon_engine.normalization import normalize_record
+
+    rows = [
+        {"name": "Ann Lee", "phone": "5551112222", "email": "ann@example.com"},
+        {"name": "Lee Anne", "phone": "5551112222", "email": "a.lee@example.com"},
+        {"name": "Bo Chan", "dob": "1990-01-02", "email": "bo@example.com"},
+        {"name": "Bo Chan", "dob": "1990-01-02", "email": "bo.chan@example.com"},
+    ]
+    records = [normalize_record(row, source_name="crm", row_num=i) for i, row in enumerate(rows, start=1)]
+    report = ClusterReport()
+    groups = cluster_records(records, 0.9, report=report)
+    assert sorted(len(g) for g in groups.values()) == [2, 2], groups
+    assert report.rule_fires == {"merge:phone_name": 1, "merge:dob_name": 1}, report.rule_fires
+
+    same_name = MatchRules(merge=[{"name": "same_name", "all": [{"field": "name", "op": "similar", "min": 0.99}]}])
+    report = ClusterReport()
+    groups = cluster_records(records, 0.9, report=report, rules=same_name)
+    assert sorted(len(g) for g in groups.values()) == [1, 1, 2], groups
+    assert report.rule_fires == {"merge:same_name": 1}, report.rule_fires
+    for bad in ({"merge": [{"name": "bad", "all": [{"field": "zip"}]}]}, {"place": [{"name": "bad", "all": ["name"]}]}):
+        try:
+            MatchRules.from_dict(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted invalid match rules {bad!r}")
+
+    plan = MatchPlan(MatchRules().place, 0.9, "place")
+    assert _plan_source(plan.rules, scaled=True) == PLACE_PLAN_SOURCE, _plan_source(plan.rules, scaled=True)
+
+    # Precomputed features must score exactly like similarity() on the raw values, case included.
+    pairs = [("Ann Lee", "ann lee"), ("LEE Ann", "Ann Lee"), ("Bo Chan", "bo  chan x"), ("A.LEE@X.COM", "a.lee@x.com")]
+    saved = matching._fuzz
+    try:
+        for fuzz in (saved, None):
+            matching._fuzz = fuzz
+            for a, b in pairs:
+                fa, fb = (matching.match_features({"name": v, "email": v}) for v in (a, b))
+                for x, y in ((fa.name_tokens, fb.name_tokens), (fa.email, fb.email)):
+                    assert matching.token_similarity(x, y) == matching.similarity(a, b), (fuzz, a, b)
+    finally:
+        matching._fuzz = saved
+
+
+def check_match_benchmark(root: Path) -> None:
+    out = subprocess.check_output(
+        [sys.executable, "scripts/bench_matching.py", "--entities", "60", "--thresholds", "0.9"],
+        cwd=root,
+        text=True,
+    )
+    results = json.loads(out)["results"]
+    assert [r["strategy"] for r in results] == ["all", "blocked"], results
+    assert all(0.0 < r["f1"] <= 1.0 and r["comparisons"] >= 0 for r in results), results
+    assert any(r["pareto"] for r in results)
+
+
+def check_result_browser(out: Path) -> None:
+    from src.recon_engine.browse import CsvPager, group_members, open_artifacts
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "rows.csv"
+        with path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["group_id", "note"])
+            writer.writerows([f"G{i % 4}", f'line {i}\n"quoted", more' if i % 5 == 0 else str(i)] for i in range(40))
+        expected = read_csv(path)
+        pager = CsvPager(str(path), stride=3)
+        assert len(pager) == 40 and pager.page(7, 9) == expected[7:16]
+        hits = pager.find({"group_id": "G2"})
+        assert pager.rows_at(hits[2:4]) == [r for r in expected if r["group_id"] == "G2"][2:4]
+
+    pagers = open_artifacts(str(out))
+    dupes = pagers["duplicate_records"].page(0, 1)[0]
+    detail = group_members(pagers, dupes["group_id"])
+    assert detail["golden"]["group_id"] == dupes["group_id"]
+    assert (dupes["source_name"], dupes["source_row"]) in {(m["source_name"], m["source_row"]) for m in detail["members"]}
+
+
+def check_preview(root: Path, report: dict) -> None:
+    from src.recon_engine.config import EngineConfig
+    from src.recon_engine.preview import KeyReservoir, run_preview
+
+    reservoir = KeyReservoir(3)
+    for i, priority in enumerate([0.9, 0.2, 0.2, 0.5, 0.1, 0.7]):
+        reservoir.offer(priority, i)
+    assert sorted(reservoir.items_below(1.0)) == [1, 2, 4] and reservoir.threshold == 0.5
+
+    preview = run_preview(EngineConfig.load(str(root / "configs" / "reconciliation_config.json")), sample_size=50)
+    assert preview["sample_records"] == preview["total_records"] == report["summary"]["total_records_ingested"]
+    assert preview["duplicate_groups"] == report["summary"]["duplicate_groups"], preview
+    rate = preview["duplicate_rate"]
+    assert rate["ci_low"] <= rate["rate"] <= rate["ci_high"], rate
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Half of the large source's records are duplicates; the small source has none.
+        big = [f"Ann{e % 97} Lee{e // 97},user{e}@example.com" for e in [*range(15000), *range(5000)]]
+        small = [f"Bo{e} Chan,bo{e}@example.com" for e in range(300)]
+        for name, rows in (("big", big), ("small", small)):
+            (Path(tmp) / f"{name}.csv").write_text("name,email\n" + "\n".join(rows) + "\n", encoding="utf-8")
+        cfg_path = Path(tmp) / "config.json"
+        cfg_path.write_text(
+            json.dumps(
+                {
+                    "sources": [
+                        {"name": name, "type": "csv", "path": str(Path(tmp) / f"{name}.csv")}
+                        for name in ("big", "small")
+                    ],
+                    "source_priority": ["big", "small"],
+                    "id_columns": ["customer_id"],
+                    "critical_columns": ["name"],
+                    "output_dir": str(Path(tmp) / "out"),
+                }
+            ),
+            encoding="utf-8",
+        )
+        sources = run_preview(EngineConfig.load(str(cfg_path)), sample_size=200)["sources"]
+    assert sources["big"]["sampled"] >= 150 and sources["small"]["sampled"] >= 150, sources
+    big_rate, small_rate = sources["big"]["duplicate_rate"], sources["small"]["duplicate_rate"]
+    assert big_rate["ci_low"] <= 0.5 <= big_rate["ci_high"] and big_rate["ci_high"] - big_rate["ci_low"] < 0.2, big_rate
+    assert small_rate["rate"] == 0.0 and small_rate["ci_high"] < 0.05, small_rate
+
+
+def check_service(root: Path) -> None:
+    import threading
+    import urllib.error
+    import urllib.request
+
+    from src.recon_engine.config import EngineConfig
+    from src.recon_engine.service import ReconciliationService, make_server
+
+    service = ReconciliationService(EngineConfig.load(str(root / "configs" / "reconciliation_config.json")))
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        body = json.dumps(
+            {"source": "web", "records": [{"name": "Eva Long", "email": "eva.long@example.com", "amount": "2100"}]}
+        ).encode("utf-8")
+        url = f"http://127.0.0.1:{server.server_address[1]}/records"
+        with urllib.request.urlopen(urllib.request.Request(url, data=body, method="POST")) as resp:
+            result = json.loads(resp.read())
+        for bad in (b"[]", b'"x"', b'{"records": ["x"]}'):
+            try:
+                urllib.request.urlopen(urllib.request.Request(url, data=bad, method="POST"))
+            except urllib.error.HTTPError as e:
+                assert e.code == 400 and "error" in json.loads(e.read()), bad
+            else:
+                raise AssertionError(f"accepted body {bad!r}")
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert result["assigned"][0]["group_key"] == "customer_id:CUST-1005", result
+    assert result["summary"]["entity_groups"] == 5 and result["summary"]["duplicate_groups"] == 4, result
+    assert result["summary"]["rule_fires"].get("merge:dob_name", 0) >= 1, result["summary"]
+
+
+def check_http_cache() -> None:
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from src.recon_engine.config import EngineConfig, SourceConfig
+    from src.recon_engine.engine import ReconciliationEngine
+
+    payload = json.dumps([{"id": "C1", "name": "Ann Lee"}, {"id": "C2", "name": "Ann Lee"}]).encode("utf-8")
+    served: list[int] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.headers.get("If-None-Match") == '"v1"':
+                served.append(304)
+                self.send_response(304)
+                self.end_headers()
+                return
+            served.append(200)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"http://127.0.0.1:{server.server_address[1]}/customers"
+            config = EngineConfig(
+                sources=[SourceConfig(name="api", type="api", path=url)],
+                source_priority=["api"],
+                id_columns=["customer_id"],
+                critical_columns=["name"],
+                output_dir=tmp,
+                similarity_threshold=0.9,
+            )
+            first = ReconciliationEngine(config).run()["summary"]
+            second = ReconciliationEngine(config).run()["summary"]
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert served == [200, 304], served
+    assert first.pop("http_cache") == {"requests": 1, "not_modified": 0, "fetched": 1, "stored": 1}, first
+    assert second.pop("http_cache") == {"requests": 1, "not_modified": 1, "fetched": 0, "stored": 0}, second
+    first.pop("delta"), second.pop("delta")
+    assert first == second, (first, second)
+
+
+def check_json_streaming() -> None:
+    import io
+
+    from src.recon_engine.json_io import iter_json_stream
+
+    payload = '{"meta": {"n": [1, 2]}, "count": 12.5, "data": [{"a": "x,]"}, {"b": 123456}], "tail": 1}'
+    items = list(iter_json_stream(io.StringIO(payload), "data", chunk_size=3))
+    assert items == [{"a": "x,]"}, {"b": 123456}], items
+
+
 def main() -> None:
     root = Path(__file__).resolve().parents[1]
     if str(root) not in sys.path:
         sys.path.insert(0, str(root))
+    check_mismatch_comparators()
+    check_sharded_source()
+    check_json_streaming()
+    check_http_cache()
+    check_csv_fast_path()
+    check_hot_keys()
+    check_exact_duplicate_collapse()
+    check_match_limits_config()
+    check_batch_normalization()
+    check_delta_output()
+    check_checkpoint_resume()
+    check_sql_source()
+    check_artifact_writer()
+    check_pdf_fallback()
+    check_lazy_imports(root)
+    check_match_benchmark(root)
+    check_stable_keys(root)
+    check_match_rules()
     subprocess.check_call([sys.executable, str(root / "scripts" / "run_demo.py")])
 
     out = root / "output"
@@ -30,6 +678,17 @@ def main() -> None:
     assert len(dupes) >= 6, f"Expected at least 6 duplicate rows, got {len(dupes)}"
     assert len(mismatches) >= 2, f"Expected at least 2 mismatch groups, got {len(mismatches)}"
 
+    from src.recon_engine.lookup import EntityLookup
+
+    with EntityLookup(str(out / "entity_index.sqlite")) as index:
+        hit = index.lookup("phone", "(555) 777-6666")
+        assert hit is not None and hit["golden"]["customer_id"] == "CUST-1003", hit
+        assert index.search_name("Johnson Alice")[0]["golden"]["customer_id"] == "CUST-1001"
+
+    check_result_browser(out)
+    check_preview(root, report)
+    check_service(root)
+
     print("All checks passed.")
 
 
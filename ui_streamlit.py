@@ -1,21 +1,27 @@
 from __future__ import annotations
 
 import json
+import math
 import os
 from pathlib import Path
 from typing import Any
 
 import streamlit as st
 
+from src.recon_engine.browse import ARTIFACTS, CsvPager, group_members
 from src.recon_engine.config import EngineConfig, SourceConfig
 from src.recon_engine.engine import ReconciliationEngine
 from src.recon_engine.ingestion import Ingestor
 from src.recon_engine.normalization import FIELD_ALIASES
+from src.recon_engine.preview import PREVIEW_SAMPLE_SIZE, run_preview
 
 
 CANONICAL_FIELDS = sorted(FIELD_ALIASES.keys())
 DEFAULT_ID_FIELDS = ["customer_id", "email", "phone"]
 DEFAULT_CRITICAL_FIELDS = ["name", "email", "phone", "address", "amount", "status"]
+PAGE_SIZES = [25, 50, 100, 250]
+# Golden rows are filtered on the source that won; other artifacts on each member's own source.
+SOURCE_COLUMNS = {"unified_dataset": "golden_source"}
 
 
 def infer_source_type(path: str) -> str:
@@ -53,6 +59,69 @@ def parse_path_input(raw: str) -> list[dict[str, str]]:
     return out
 
 
+@st.cache_resource(max_entries=16)
+def _cached_pager(path: str, mtime_ns: int, size: int) -> CsvPager:
+    return CsvPager(path)
+
+
+@st.cache_resource(max_entries=64)
+def _cached_positions(path: str, mtime_ns: int, size: int, filters: tuple[tuple[str, str], ...]) -> Any:
+    return _cached_pager(path, mtime_ns, size).find(dict(filters))
+
+
+def _artifact_key(out_dir: str, name: str) -> tuple[str, int, int]:
+    path = str(Path(out_dir) / f"{name}.csv")
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def render_browser(out_dir: str) -> None:
+    available = [name for name in ARTIFACTS if (Path(out_dir) / f"{name}.csv").exists()]
+    if not available:
+        return
+    st.subheader("Browse Results")
+    keys = {name: _artifact_key(out_dir, name) for name in available}
+    pagers = {name: _cached_pager(*key) for name, key in keys.items()}
+
+    artifact = st.selectbox("Artifact", available)
+    pager = pagers[artifact]
+    cols = st.columns(4)
+    group_id = cols[0].text_input("Group ID").strip()
+    source = cols[1].text_input("Source").strip()
+    mismatch_field = cols[2].selectbox("Mismatch field", [""] + CANONICAL_FIELDS)
+    page_size = cols[3].selectbox("Rows per page", PAGE_SIZES, index=1)
+
+    filters = {
+        "group_id": group_id,
+        SOURCE_COLUMNS.get(artifact, "source_name"): source,
+        "mismatch_fields": mismatch_field,
+    }
+    active = tuple(sorted((k, v) for k, v in filters.items() if v and k in pager.header))
+    positions = _cached_positions(*keys[artifact], active) if active else None
+    total = len(pager) if positions is None else len(positions)
+    pages = max(1, math.ceil(total / page_size))
+    page = int(st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1))
+    start = (page - 1) * page_size
+    if positions is None:
+        rows = pager.page(start, page_size)
+    else:
+        rows = pager.rows_at(positions[start : start + page_size])
+    st.caption(f"{total} matching rows of {len(pager)}")
+    st.dataframe(rows)
+
+    group_ids = sorted({row["group_id"] for row in rows if row.get("group_id")})
+    selected = st.selectbox("Drill into group", [""] + group_ids)
+    if selected:
+        detail = group_members(pagers, selected)
+        if detail["golden"]:
+            st.write("Golden record")
+            st.json(detail["golden"])
+        if detail["mismatch"]:
+            st.write(f"Mismatched fields: {detail['mismatch']['mismatch_fields']}")
+        st.write("Member records")
+        st.dataframe(detail["members"] or [detail["golden"]])
+
+
 def main() -> None:
     st.set_page_config(page_title="Reconciliation Engine", page_icon=":bar_chart:", layout="wide")
     st.title("Multi-Source Data Reconciliation")
@@ -67,6 +136,9 @@ def main() -> None:
         threshold = st.slider("Fuzzy matching threshold", min_value=0.70, max_value=0.99, value=0.88, step=0.01)
         id_cols = st.multiselect("Entity ID columns", CANONICAL_FIELDS, default=DEFAULT_ID_FIELDS)
         critical_cols = st.multiselect("Critical mismatch columns", CANONICAL_FIELDS, default=DEFAULT_CRITICAL_FIELDS)
+        preview_size = int(
+            st.number_input("Preview sample per source", min_value=10, value=PREVIEW_SAMPLE_SIZE, step=100)
+        )
         alias_json = st.text_area(
             "Global field aliases (JSON: canonical -> [aliases])",
             value=json.dumps(FIELD_ALIASES, indent=2),
@@ -92,6 +164,7 @@ def main() -> None:
 
     if not sources:
         st.info("Add at least one source to continue.")
+        render_browser(out_dir)
         return
 
     st.subheader("Source Mapping")
@@ -136,18 +209,35 @@ def main() -> None:
 
             configured_sources.append(SourceConfig(name=name, type=source_type, path=path, field_map=field_map))
 
-    if st.button("Run Reconciliation", type="primary"):
+    def build_config() -> EngineConfig:
+        aliases = json.loads(alias_json) if alias_json.strip() else {}
+        return EngineConfig(
+            sources=configured_sources,
+            source_priority=[s.name for s in configured_sources],
+            id_columns=id_cols or DEFAULT_ID_FIELDS,
+            critical_columns=critical_cols or DEFAULT_CRITICAL_FIELDS,
+            output_dir=out_dir,
+            similarity_threshold=float(threshold),
+            field_aliases=aliases,
+        )
+
+    run_col, preview_col = st.columns(2)
+    if preview_col.button("Preview on Sample"):
         try:
-            aliases = json.loads(alias_json) if alias_json.strip() else {}
-            config = EngineConfig(
-                sources=configured_sources,
-                source_priority=[s.name for s in configured_sources],
-                id_columns=id_cols or DEFAULT_ID_FIELDS,
-                critical_columns=critical_cols or DEFAULT_CRITICAL_FIELDS,
-                output_dir=out_dir,
-                similarity_threshold=float(threshold),
-                field_aliases=aliases,
-            )
+            preview = run_preview(build_config(), sample_size=preview_size)
+            dup = preview["duplicate_rate"]
+            mis = preview["mismatch_rate"]
+            metrics = st.columns(3)
+            metrics[0].metric("Sampled records", f"{preview['sample_records']} / {preview['total_records']}")
+            metrics[1].metric("Duplicate rate", f"{dup['rate']:.1%}", f"{dup['ci_low']:.1%} to {dup['ci_high']:.1%}", delta_color="off")
+            metrics[2].metric("Mismatch rate", f"{mis['rate']:.1%}", f"{mis['ci_low']:.1%} to {mis['ci_high']:.1%}", delta_color="off")
+            st.json(preview)
+        except Exception as e:
+            st.error(f"Preview failed: {e}")
+
+    if run_col.button("Run Reconciliation", type="primary"):
+        try:
+            config = build_config()
             result = ReconciliationEngine(config).run()
             st.success("Reconciliation completed.")
             st.json(result["summary"])
@@ -155,6 +245,8 @@ def main() -> None:
         except Exception as e:
             st.error(f"Run failed: {e}")
 
+    render_browser(out_dir)
+
 
 if __name__ == "__main__":
     main()